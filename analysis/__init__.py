@@ -2,6 +2,7 @@ from .correlation import correlation
 from .countries import countries
 from .duration_curve import duration_curve
 from .optimization_log import optimization_log
+from .profile import profile
 from .sensitivity import sensitivity
 from .statistics import statistics
 from .temporal_results import temporal_results
@@ -0,0 +1,52 @@
+import pandas as pd
+import streamlit as st
+
+import utils
+import validate
+
+
+def profile(output_directory, resolution):
+    """
+    Show the duration and peak memory usage of each step and the model statistics
+    """
+    assert validate.is_directory_path(output_directory)
+    assert validate.is_resolution(resolution)
+
+    st.title("⏱️ Profile")
+
+    # Show a warning if the run has been made before profiles were stored
+    profile_filepath = output_directory / resolution / "profile.yaml"
+    if not profile_filepath.is_file():
+        st.warning("There is no profile available for this run")
+        return
+
+    # Read the profile
+    profile = utils.read_yaml(profile_filepath)
+    steps = pd.DataFrame(profile["steps"])
+    duration_per_step = steps.groupby("step", sort=False).duration.sum()
+
+    # Show the total duration, the peak memory usage, and the size of the model
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total duration", f"{duration_per_step.sum():,.1f}s")
+    col2.metric("Peak memory", f"{steps.peak_memory_MB.max():,.0f}MB" if steps.peak_memory_MB.notna().any() else "-")
+    col3.metric("Variables", f"{profile['model'].get('NumVars', 0):,}")
+
+    # Show the duration per step
+    st.subheader("Duration per step")
+    st.bar_chart(duration_per_step)
+
+    # Show the duration of the steps that are run per bidding zone
+    bidding_zone_steps = steps[steps.bidding_zone.notna()]
+    if not bidding_zone_steps.empty:
+        st.subheader("Duration per bidding zone")
+        st.dataframe(bidding_zone_steps.pivot_table(index="bidding_zone", columns="step", values="duration", aggfunc="sum", sort=False))
+
+    # Show the peak memory usage after each step
+    with st.expander("Memory usage"):
+        st.line_chart(steps.peak_memory_MB.rename("Peak memory (MB)"))
+
+    # Show the model and presolve statistics
+    with st.expander("Model statistics", expanded=True):
+        col1, col2 = st.columns(2)
+        col1.table(pd.Series(profile["model"], name="Model", dtype="object").astype(str))
+        col2.table(pd.Series(profile["presolve"], name="Presolve", dtype="object").astype(str))
@@ -0,0 +1,3 @@
+from .generate_input import generate_input
+from .run_benchmark import run_benchmark
+from .run_micro_benchmarks import run_micro_benchmarks
@@ -0,0 +1,122 @@
+import argparse
+from datetime import datetime
+import json
+import pathlib
+import platform
+import subprocess
+
+import utils
+
+from .run_benchmark import run_benchmark
+from .run_micro_benchmarks import run_micro_benchmarks
+
+
+def _get_commit():
+    """
+    Return the hash of the current commit, or None if it can't be determined
+    """
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _read_previous_results(history_filepath):
+    """
+    Return the results of the last recorded run of each scenario or function in the history file
+    """
+    previous_results = {}
+    if history_filepath.is_file():
+        with open(history_filepath) as f:
+            for line in f:
+                record = json.loads(line)
+                previous_results[record["scenario"]] = record["results"]
+    return previous_results
+
+
+def _format_change(value, previous_value):
+    """
+    Return the value with the relative change compared to the previous value
+    """
+    if value is None:
+        return "-"
+    if not previous_value:
+        return f"{value:,}"
+    return f"{value:,} ({value / previous_value - 1:+.0%})"
+
+
+def _append_to_history(history_filepath, *, name, parameters, results):
+    """
+    Append the results of a scenario or function to the history file
+    """
+    record = {"timestamp": datetime.now().isoformat(timespec="seconds"), "commit": _get_commit(), "machine": platform.node(), "scenario": name, "parameters": parameters, "results": results}
+    with open(history_filepath, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _run_micro_benchmarks(args):
+    """
+    Run the micro-benchmarks of the utils functions and append the results to the history file
+    """
+    history_filepath = args.history or utils.path("benchmark", "micro_history.jsonl")
+    previous_results = _read_previous_results(history_filepath)
+    results = run_micro_benchmarks(year_counts=args.years, repeat=args.repeat)
+
+    # Show the results per function with the relative change compared to the last recorded run
+    for function_name, function_results in results.items():
+        print(function_name)
+        for year_count, year_count_results in function_results.items():
+            previous_year_count_results = previous_results.get(function_name, {}).get(str(year_count), {})
+            formatted_results = [f"{key}={_format_change(value, previous_year_count_results.get(key))}" for key, value in year_count_results.items()]
+            print(f"  {year_count} years: {', '.join(formatted_results)}")
+
+        if not args.no_record:
+            _append_to_history(history_filepath, name=function_name, parameters={"repeat": args.repeat}, results={str(year_count): year_count_results for year_count, year_count_results in function_results.items()})
+
+
+def main():
+    """
+    Run the benchmark scenarios or the micro-benchmarks on synthetic input and append the results to the history file
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Benchmark the model build, solve, and store time or the utils functions on synthetic input")
+    parser.add_argument("scenarios", nargs="*", default=["tiny", "small"], help="names of the scenarios to run (default: tiny small)")
+    parser.add_argument("--scenarios-file", type=pathlib.Path, default=utils.path("benchmark", "scenarios.yaml"), help="path to the .yaml file with the scenario definitions")
+    parser.add_argument("--history", type=pathlib.Path, help="path to the .jsonl file to which the results are appended (default: benchmark/history.jsonl or benchmark/micro_history.jsonl)")
+    parser.add_argument("--workspace", type=pathlib.Path, help="directory in which the synthetic input and output are kept (default: a temporary directory)")
+    parser.add_argument("--no-record", action="store_true", help="don't append the results to the history file")
+    parser.add_argument("--micro", action="store_true", help="run the micro-benchmarks of the utils functions instead of the scenarios")
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 10, 35], help="number of climate years of the micro-benchmark fixtures (default: 1 10 35)")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed calls per micro-benchmark (default: 5)")
+    args = parser.parse_args()
+
+    if args.micro:
+        _run_micro_benchmarks(args)
+        return
+
+    # Read the scenario definitions
+    scenarios = utils.read_yaml(args.scenarios_file)
+    unknown_scenarios = [scenario_name for scenario_name in args.scenarios if scenario_name not in scenarios]
+    if unknown_scenarios:
+        parser.error(f"Unknown scenarios: {', '.join(unknown_scenarios)}")
+
+    history_filepath = args.history or utils.path("benchmark", "history.jsonl")
+    previous_results = _read_previous_results(history_filepath)
+    for scenario_name in args.scenarios:
+        print(f"Running the '{scenario_name}' scenario", flush=True)
+        workspace_directory = args.workspace / scenario_name if args.workspace else None
+        results = run_benchmark(scenario_name, scenarios[scenario_name], workspace_directory=workspace_directory)
+        if results is None:
+            print(f"The optimization of the '{scenario_name}' scenario failed, see benchmark.log in the workspace")
+            continue
+
+        # Show the results with the relative change compared to the last recorded run
+        for resolution, resolution_results in results.items():
+            previous_resolution_results = previous_results.get(scenario_name, {}).get(resolution, {})
+            formatted_results = [f"{key}={_format_change(value, previous_resolution_results.get(key))}" for key, value in resolution_results.items()]
+            print(f"  {utils.format_resolution(resolution)}: {', '.join(formatted_results)}")
+
+        # Append the results to the history file
+        if not args.no_record:
+            _append_to_history(history_filepath, name=scenario_name, parameters=scenarios[scenario_name], results=results)
+
+
+if __name__ == "__main__":
+    main()
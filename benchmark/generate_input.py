@@ -0,0 +1,77 @@
+import math
+import numpy as np
+import pandas as pd
+import shutil
+import string
+
+import utils
+import validate
+
+
+def _get_country_codes(country_count):
+    """
+    Return a list of synthetic two-letter country codes
+    """
+    return [f"{first_letter}{second_letter}" for first_letter in string.ascii_uppercase for second_letter in string.ascii_uppercase][:country_count]
+
+
+def generate_input(input_directory, *, bidding_zone_count, climate_zone_count, climate_years, days_per_year=365, bidding_zones_per_country=1, model_year=2030, seed=0):
+    """
+    Generate a synthetic input directory with countries, bidding zones, and interconnections between neighbouring bidding zones
+    """
+    assert validate.is_directory_path(input_directory)
+    assert validate.is_integer(bidding_zone_count, min_value=3)
+    assert validate.is_integer(climate_zone_count, min_value=1, max_value=100)
+    assert validate.is_list_like(climate_years)
+    assert validate.is_integer(days_per_year, min_value=2, max_value=365)
+    assert validate.is_integer(bidding_zones_per_country, min_value=1, max_value=99)
+    assert validate.is_model_year(model_year)
+    assert validate.is_integer(seed)
+
+    rng = np.random.default_rng(seed)
+    country_codes = _get_country_codes(math.ceil(bidding_zone_count / bidding_zones_per_country))
+    bidding_zones_per_country_code = {country_code: [f"{country_code}{index:02}" for index in range(bidding_zones_per_country)] for country_code in country_codes}
+    bidding_zones = [bidding_zone for bidding_zones_in_country in bidding_zones_per_country_code.values() for bidding_zone in bidding_zones_in_country][:bidding_zone_count]
+
+    # Copy the technology assumptions
+    (input_directory / "technologies").mkdir(parents=True, exist_ok=True)
+    for technology_type in ["production", "storage"]:
+        shutil.copy(utils.path("input", "technologies", f"{technology_type}.yaml"), input_directory / "technologies" / f"{technology_type}.yaml")
+
+    # Create the countries with their bidding zones
+    countries = [{"name": f"Synthetic {country_code}", "nuts_2": country_code, "alpha_3": f"{country_code}X", "flag": "🏳️", "bidding_zones": [bidding_zone for bidding_zone in bidding_zones_in_country if bidding_zone in bidding_zones], "potential": {"onshore": 10 ** 6}} for country_code, bidding_zones_in_country in bidding_zones_per_country_code.items()]
+    utils.write_yaml(input_directory / "countries.yaml", countries, exist_ok=True)
+
+    # Create the hourly timestamps of the first days of each climate year
+    index = pd.DatetimeIndex([], tz="UTC")
+    for climate_year in climate_years:
+        climate_year_index = pd.date_range(f"{climate_year}-01-01", periods=days_per_year * 24, freq="1H", tz="UTC")
+        index = index.append(climate_year_index[~((climate_year_index.month == 2) & (climate_year_index.day == 29))])
+    hours = index.hour.to_numpy()
+
+    # Generate the demand and capacity factors of each bidding zone
+    (input_directory / "bidding_zones" / str(model_year)).mkdir(parents=True, exist_ok=True)
+    for bidding_zone in bidding_zones:
+        temporal_data = pd.DataFrame(index=index)
+        temporal_data["demand_MW"] = rng.uniform(500, 5000) * (1 + 0.3 * np.sin(2 * np.pi * hours / 24) + rng.uniform(0, 0.2, len(index)))
+        for climate_zone in range(climate_zone_count):
+            temporal_data[f"pv_{climate_zone:02}_cf"] = np.clip(np.sin(np.pi * (hours - 6) / 12), 0, None) * rng.uniform(0.5, 1, len(index))
+            temporal_data[f"onshore_{climate_zone:02}_cf"] = rng.uniform(0, 1, len(index)) ** 2
+            temporal_data[f"offshore_{climate_zone:02}_cf"] = rng.uniform(0, 1, len(index)) ** 1.5
+        temporal_data.to_csv(input_directory / "bidding_zones" / str(model_year) / f"{bidding_zone}.csv")
+        utils.create_temporal_data_store(temporal_data, input_directory / "bidding_zones" / str(model_year) / bidding_zone)
+
+    # Connect each bidding zone with HVAC to the next bidding zone and with HVDC to the bidding zone after that
+    (input_directory / "interconnections" / str(model_year)).mkdir(parents=True, exist_ok=True)
+    model_year_index = pd.date_range(f"{model_year}-01-01", f"{model_year}-12-31 23:00", freq="1H", tz="UTC")
+    for connection_type, offset in [("hvac", 1), ("hvdc", 2)]:
+        interconnections = []
+        for index_from, bidding_zone_from in enumerate(bidding_zones):
+            if index_from + offset < len(bidding_zones):
+                bidding_zone_to = bidding_zones[index_from + offset]
+                interconnections += [(bidding_zone_from, bidding_zone_to), (bidding_zone_to, bidding_zone_from)]
+        columns = pd.MultiIndex.from_tuples(sorted(interconnections))
+        export_limits = pd.DataFrame(rng.uniform(100, 2000, (len(model_year_index), len(columns))), index=model_year_index, columns=columns)
+        export_limits.to_csv(input_directory / "interconnections" / str(model_year) / f"{connection_type}.csv")
+
+    return country_codes
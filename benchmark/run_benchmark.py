@@ -0,0 +1,97 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import multiprocessing
+import os
+import pathlib
+import tempfile
+
+import optimization
+import utils
+import validate
+
+from .generate_input import generate_input
+
+
+# Map the steps in the profile to the phases that are reported in the benchmark
+PHASES = {"build": ["1", "2A", "2B", "2C", "2D", "2E", "3", "4", "5", "6", "update"], "solve": ["7"], "store": ["8", "9"]}
+
+
+def _create_config(scenario, *, name, country_codes, climate_years):
+    """
+    Return the config for a benchmark scenario
+    """
+    return {
+        "name": name,
+        "model_year": 2030,
+        "country_codes": country_codes,
+        "climate_years": {"start": climate_years[0], "end": climate_years[-1]},
+        "technologies": {
+            "relative_baseload": 0.2,
+            "production": {"pv": 0, "onshore": 0, "offshore": 0},
+            "storage": {storage_technology: 0 for storage_technology in ["lion", "hydrogen"][: scenario["storage_technology_count"]]},
+        },
+        "interconnections": {"efficiency": {"hvac": 0.95, "hvdc": 0.95}, "min_self_sufficiency": 0.8, "relative_capacity": 1.0},
+        "time_discretization": {"resolution_stages": scenario["resolution_stages"], "capacity_propagation": 1.0, "soc_propagation": 1.0},
+        "optimization": {"method": scenario.get("method", 2), "thread_count": scenario.get("thread_count", 1), "store_model": False},
+        "upload_results": False,
+        "send_notification": False,
+    }
+
+
+def _run_scenario(config, *, workspace_directory):
+    """
+    Run the optimization of a scenario in the workspace directory and return the profile of each resolution
+    """
+    # Use the synthetic input directory and write the console output to a log file
+    os.chdir(workspace_directory)
+    output_directory = utils.path("output", config["name"])
+    output_directory.mkdir(parents=True)
+    with open("benchmark.log", "w") as f, redirect_stdout(f):
+        optimization.run(config, status=optimization.ConsoleStatus(show_solver_log=False), output_directory=output_directory)
+
+    # Return the profiles, the run has failed if the config has not been stored
+    if not (output_directory / "config.yaml").is_file():
+        return None
+    return {resolution: utils.read_yaml(output_directory / resolution / "profile.yaml") for resolution in config["time_discretization"]["resolution_stages"]}
+
+
+def _summarize_profile(profile):
+    """
+    Return the duration per phase, the peak memory usage, and the model size of a resolution
+    """
+    summary = {}
+    for phase, steps in PHASES.items():
+        summary[f"{phase}_time"] = round(sum(step["duration"] for step in profile["steps"] if step["step"] in steps), 4)
+    peak_memory = [step["peak_memory_MB"] for step in profile["steps"] if step["peak_memory_MB"] is not None]
+    summary["peak_memory_MB"] = max(peak_memory) if peak_memory else None
+    for attribute in ["NumVars", "NumConstrs", "NumNZs"]:
+        summary[attribute] = profile["model"].get(attribute)
+    return summary
+
+
+def run_benchmark(scenario_name, scenario, *, workspace_directory=None):
+    """
+    Generate the synthetic input for a scenario, run the optimization in a separate process, and return the results per resolution
+    """
+    assert validate.is_string(scenario_name, min_length=1)
+    assert validate.is_dict(scenario)
+    assert validate.is_directory_path(workspace_directory, required=False)
+
+    # Use a temporary workspace if no workspace directory is given
+    if workspace_directory is None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            return run_benchmark(scenario_name, scenario, workspace_directory=pathlib.Path(temporary_directory))
+
+    # Generate the synthetic input
+    workspace_directory = workspace_directory.resolve()
+    climate_years = list(range(2016 - scenario["climate_year_count"] + 1, 2017))
+    country_codes = generate_input(workspace_directory / "input", bidding_zone_count=scenario["bidding_zone_count"], climate_zone_count=scenario["climate_zone_count"], climate_years=climate_years, days_per_year=scenario.get("days_per_year", 365), seed=scenario.get("seed", 0))
+
+    # Run the scenario in a new process, so the memory usage is measured per scenario and the cached input files are not shared
+    config = _create_config(scenario, name=scenario_name, country_codes=country_codes, climate_years=climate_years)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        profiles = executor.submit(_run_scenario, config, workspace_directory=workspace_directory).result()
+
+    if profiles is None:
+        return None
+    return {resolution: _summarize_profile(profile) for resolution, profile in profiles.items()}
@@ -0,0 +1,146 @@
+import numpy as np
+import os
+import pandas as pd
+import pathlib
+import statistics
+import tempfile
+import time
+import tracemalloc
+import streamlit as st
+
+import utils
+import validate
+
+from .generate_input import generate_input
+
+
+def _create_config(country_codes, climate_years):
+    """
+    Return a minimal config for the synthetic input
+    """
+    return {
+        "name": "micro_benchmark",
+        "model_year": 2030,
+        "country_codes": country_codes,
+        "climate_years": {"start": climate_years[0], "end": climate_years[-1]},
+        "technologies": {"relative_baseload": 0.2, "production": {"pv": 0, "onshore": 0, "offshore": 0}, "storage": {"lion": 0, "hydrogen": 0}},
+        "interconnections": {"efficiency": {"hvac": 0.95, "hvdc": 0.95}, "min_self_sufficiency": 0.8, "relative_capacity": 1.0},
+        "time_discretization": {"resolution_stages": ["1H"], "capacity_propagation": 1.0, "soc_propagation": 1.0},
+        "optimization": {"method": 2, "thread_count": 1, "store_model": False},
+        "upload_results": False,
+        "send_notification": False,
+    }
+
+
+def _create_eraa_workbook(filepath, *, bidding_zone, climate_years, rng):
+    """
+    Create an Excel workbook with the same layout as the ERAA files, a sheet per zone with a column per climate year
+    """
+    dates = pd.date_range("2030-01-01", "2030-12-31 23:00", freq="1H")
+    sheet = pd.DataFrame({"Date": dates.strftime("%d.%m."), "Hour": dates.hour + 1})
+    for climate_year in climate_years:
+        sheet[climate_year] = rng.uniform(0, 1, len(dates))
+    with pd.ExcelWriter(filepath) as writer:
+        sheet.to_excel(writer, sheet_name=bidding_zone, startrow=10, index=False)
+    return list(zip(sheet.Date, sheet.Hour))
+
+
+def _create_fixtures(workspace_directory, *, country_codes, climate_years, rng):
+    """
+    Create the synthetic output files in the workspace directory and return a function per benchmark that calls the benchmarked function with the fixtures
+    """
+    config = _create_config(country_codes, climate_years)
+    bidding_zones = utils.get_bidding_zones_for_countries(country_codes)
+
+    # Read the temporal data and create temporal results with the columns that are written by the optimization
+    temporal_data = {bidding_zone: utils.read_temporal_data(utils.path("input", "bidding_zones", 2030, f"{bidding_zone}.csv")) for bidding_zone in bidding_zones}
+    temporal_results = {}
+    for bidding_zone, temporal_data_bidding_zone in temporal_data.items():
+        timestamp_count = len(temporal_data_bidding_zone.index)
+        temporal_results[bidding_zone] = pd.DataFrame({"demand_MW": temporal_data_bidding_zone.demand_MW, "baseload_MW": temporal_data_bidding_zone.demand_MW.mean() * 0.2}, index=temporal_data_bidding_zone.index)
+        temporal_results[bidding_zone]["production_total_MW"] = temporal_data_bidding_zone.demand_MW * rng.uniform(0.5, 1.5, timestamp_count)
+        for storage_technology in config["technologies"]["storage"]:
+            temporal_results[bidding_zone][f"net_storage_flow_{storage_technology}_MW"] = rng.normal(0, 100, timestamp_count)
+        for connection_type in config["interconnections"]["efficiency"]:
+            temporal_results[bidding_zone][f"net_export_{connection_type}_MW"] = rng.normal(0, 100, timestamp_count)
+
+    # Store the temporal results like the output of a run
+    output_directory = utils.path("output", "micro_benchmark")
+    (output_directory / "1H" / "temporal_results").mkdir(parents=True)
+    utils.write_yaml(output_directory / "config.yaml", config)
+    for bidding_zone in bidding_zones:
+        temporal_results[bidding_zone].to_csv(output_directory / "1H" / "temporal_results" / f"{bidding_zone}.csv")
+
+    # Create the optimal capacities for the LCOE
+    production_capacities = {bidding_zone: pd.DataFrame(rng.uniform(0, 1000, (2, 3)), index=["00", "01"], columns=["pv", "onshore", "offshore"]) for bidding_zone in bidding_zones}
+    storage_capacities = {bidding_zone: pd.DataFrame(rng.uniform(0, 1000, (2, 2)), index=["lion", "hydrogen"], columns=["energy", "power"]) for bidding_zone in bidding_zones}
+    demand = utils.merge_dataframes_on_column(temporal_data, "demand_MW")
+
+    # Create the ERAA workbook for the first bidding zone
+    eraa_filepath = workspace_directory / "eraa.xlsx"
+    eraa_index = _create_eraa_workbook(eraa_filepath, bidding_zone=bidding_zones[0], climate_years=climate_years, rng=rng)
+
+    # Return a function per benchmark that calls the benchmarked function with the fixtures
+    return {
+        "create_datetime_index": lambda: [utils.create_datetime_index(eraa_index, climate_year) for climate_year in climate_years],
+        "import_eraa_workbook": lambda: utils.import_eraa_workbook(eraa_filepath, bidding_zones=bidding_zones, column_name="pv_{bidding_zone}_cf"),
+        "get_export_limits": lambda: [utils.get_export_limits(bidding_zone, config=config, connection_type="hvac", index=temporal_data[bidding_zone].index) for bidding_zone in bidding_zones],
+        "read_temporal_data": lambda: utils.read_temporal_data(utils.path("input", "bidding_zones", 2030, f"{bidding_zones[0]}.csv"), start_year=climate_years[-1], end_year=climate_years[-1], columns=["demand_MW"]),
+        "calculate_lcoe": lambda: utils.calculate_lcoe(production_capacities, storage_capacities, demand, config=config),
+        "merge_dataframes_on_column": lambda: utils.merge_dataframes_on_column(temporal_results, "demand_MW"),
+        "get_temporal_results": lambda: utils.get_temporal_results.__wrapped__(output_directory, "1H", group="country"),
+        "calculate_curtailed_energy_post_hoc": lambda: utils.calculate_curtailed_energy_post_hoc(temporal_results[bidding_zones[0]], config=config),
+    }
+
+
+def _measure(function, *, repeat):
+    """
+    Return the median duration, the peak memory allocated during a call, and the memory retained after a call of the function, with empty Streamlit caches before each call
+    """
+    durations = []
+    for _ in range(repeat):
+        st.experimental_memo.clear()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    # Measure the allocations in a separate call, since tracing slows down the function
+    st.experimental_memo.clear()
+    tracemalloc.start()
+    function()
+    retained_memory, peak_allocated_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"time_s": round(statistics.median(durations), 6), "retained_MB": round(retained_memory / 1024 ** 2, 3), "peak_allocated_MB": round(peak_allocated_memory / 1024 ** 2, 3)}
+
+
+def run_micro_benchmarks(*, year_counts, repeat=5, seed=0):
+    """
+    Time the utils functions on the hot paths on synthetic hourly fixtures with the given number of climate years
+    """
+    assert validate.is_list_like(year_counts)
+    assert all(validate.is_integer(year_count, min_value=1, max_value=35) for year_count in year_counts)
+    assert validate.is_integer(repeat, min_value=1)
+    assert validate.is_integer(seed)
+
+    results = {}
+    working_directory = pathlib.Path.cwd()
+    for year_count in year_counts:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            # Generate the synthetic input in a temporary workspace
+            workspace_directory = pathlib.Path(temporary_directory)
+            climate_years = list(range(2016 - year_count + 1, 2017))
+            country_codes = generate_input(workspace_directory / "input", bidding_zone_count=4, climate_zone_count=2, climate_years=climate_years, bidding_zones_per_country=2, seed=seed)
+
+            # Use the workspace as working directory, so the relative input paths resolve to the synthetic input
+            os.chdir(workspace_directory)
+            try:
+                st.experimental_memo.clear()
+                benchmarks = _create_fixtures(workspace_directory, country_codes=country_codes, climate_years=climate_years, rng=np.random.default_rng(seed))
+                for name, function in benchmarks.items():
+                    results.setdefault(name, {})[year_count] = _measure(function, repeat=repeat)
+            finally:
+                os.chdir(working_directory)
+                st.experimental_memo.clear()
+
+    return results
@@ -1,24 +1,29 @@
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+import multiprocessing
+import numpy as np
+import os
 import pandas as pd
-import streamlit as st
+import queue
 
 import stats
 import utils
 import validate
 
+from .find_relative_storage_costs import find_relative_storage_costs
 from .optimize import optimize
-from .status import Status
+from .status import ConsoleStatus, QueueStatus, Status
 
 
-def run(config, *, status=None, output_directory):
+def run(config, *, status=None, output_directory, parametric_models=None, is_sensitivity_step=False, thread_count=None):
     """
-    Run the model with the given configuration file
+    Run the model with the given configuration file, optionally with another thread count than the config without changing the stored config
     """
     assert validate.is_config(config)
     assert validate.is_directory_path(output_directory)
-
-    # Check if this run is not part of a sensitivity analysis
-    is_standalone_run = status is None
+    assert validate.is_dict(parametric_models, required=False)
+    assert validate.is_bool(is_sensitivity_step)
+    assert validate.is_integer(thread_count, min_value=1, required=False)
 
     # Initialize a status object if not defined yet
     if status is None:
@@ -27,7 +32,7 @@ def run(config, *, status=None, output_directory):
     results = {}
     previous_resolution = None
     for resolution in utils.get_sorted_resolution_stages(config, descending=True):
-        results[resolution] = optimize(config, resolution=resolution, previous_resolution=previous_resolution, status=status, output_directory=output_directory)
+        results[resolution] = optimize(config, resolution=resolution, previous_resolution=previous_resolution, status=status, output_directory=output_directory, parametric_models=parametric_models, thread_count=thread_count)
 
         # Store the duration of all resolutions after each optimization
         duration = {resolution: results[resolution]["duration"] for resolution in results}
@@ -47,28 +52,94 @@ def run(config, *, status=None, output_directory):
     utils.write_yaml(output_directory / "config.yaml", config)
 
     # Set the final status and send a message
-    if is_standalone_run:
+    if not is_sensitivity_step:
         status.update(f"Optimization has finished and results are stored", status_type="success")
         if config["send_notification"]:
             utils.send_notification(f"Optimization '{config['name']}' has finished")
 
 
-def run_sensitivity(config, sensitivity_config):
+def _run_sensitivity_worker(step_configs, *, output_directory, status_queue, parametric, thread_count):
+    """
+    Run a chunk of sensitivity steps one after another in a worker process and send the status updates to the main process
+    """
+    assert validate.is_dict(step_configs)
+    assert validate.is_directory_path(output_directory)
+    assert validate.is_bool(parametric)
+    assert validate.is_integer(thread_count, min_value=1)
+
+    parametric_models = {} if parametric else None
+    for step_key, step_config in step_configs.items():
+        run(step_config, status=QueueStatus(status_queue, step_key=step_key), output_directory=output_directory / step_key, parametric_models=parametric_models, is_sensitivity_step=True, thread_count=thread_count)
+        if step_config["send_notification"]:
+            utils.send_notification(f"Optimization {step_key} of '{step_config['name']}' has finished")
+
+
+def _run_sensitivity_steps_in_parallel(step_configs, *, number_of_workers, output_directory, status, parametric):
+    """
+    Run the sensitivity steps on a pool of worker processes and split the cores of the machine over the workers
+    """
+    assert validate.is_dict(step_configs)
+    assert validate.is_integer(number_of_workers, min_value=2)
+    assert validate.is_directory_path(output_directory)
+    assert validate.is_bool(parametric)
+
+    # Split the steps in contiguous chunks, so the parametric models of each worker are updated with small changes
+    step_keys = list(step_configs.keys())
+    chunks = [{step_key: step_configs[step_key] for step_key in chunk_step_keys.tolist()} for chunk_step_keys in np.array_split(step_keys, number_of_workers)]
+
+    # Divide the cores over the workers, the thread count is passed to the workers so the stored configs keep the configured thread count
+    thread_count = max(1, os.cpu_count() // number_of_workers)
+
+    # Create a status line for each worker
+    status.header(f"Sensitivity runs ({len(step_keys)} steps on {number_of_workers} workers)")
+    worker_statuses = {}
+    for chunk in chunks:
+        worker_status = status.create_sub_status()
+        for step_key in chunk:
+            worker_statuses[step_key] = worker_status
+
+    # Run the chunks in spawned processes, so the workers don't inherit the state of the Streamlit server
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager, ProcessPoolExecutor(max_workers=number_of_workers, mp_context=context) as executor:
+        status_queue = manager.Queue()
+        futures = [executor.submit(_run_sensitivity_worker, chunk, output_directory=output_directory, status_queue=status_queue, parametric=parametric, thread_count=thread_count) for chunk in chunks]
+
+        # Show the status updates of the workers until all workers have finished
+        finished_step_count = 0
+        while not all(future.done() for future in futures) or not status_queue.empty():
+            try:
+                step_key, text, status_type = status_queue.get(timeout=0.5)
+                worker_statuses[step_key].update(f"{step_key}: {text}", status_type=status_type)
+            except queue.Empty:
+                pass
+            current_finished_step_count = sum((output_directory / step_key / "config.yaml").is_file() for step_key in step_keys)
+            if current_finished_step_count != finished_step_count:
+                finished_step_count = current_finished_step_count
+                status.update(f"{finished_step_count}/{len(step_keys)} sensitivity runs have finished")
+
+        # Raise the errors that occured in the workers
+        for future in futures:
+            future.result()
+
+
+def run_sensitivity(config, sensitivity_config, *, status=None):
     """
     Run the model for each step in the sensitivity analysis
     """
     assert validate.is_config(config)
     assert validate.is_sensitivity_config(sensitivity_config)
 
-    status = Status()
+    # Initialize a status object if not defined yet
+    if status is None:
+        status = Status()
     output_directory = utils.path("output", config["name"])
 
     # Run a specific sensitivity analysis for the curtailment
     if sensitivity_config["analysis_type"] == "curtailment":
         # Calculate the optimal storage costs
-        st.subheader(f"Sensitivity run 1.000")
+        status.header(f"Sensitivity run 1.000")
         highest_resolution = utils.get_sorted_resolution_stages(config)[0]
-        run(config, status=status, output_directory=output_directory / "1.000")
+        run(config, status=status, output_directory=output_directory / "1.000", is_sensitivity_step=True)
         optimal_storage_costs = {resolution: stats.firm_lcoe(output_directory / "1.000", resolution, breakdown_level=1)["storage"] for resolution in config["time_discretization"]["resolution_stages"]}
 
         # Send the notification
@@ -78,55 +149,69 @@ def run_sensitivity(config, sensitivity_config):
         # Add the steps dictionary to the sensitivity config
         sensitivity_config["steps"] = {"1.000": 1.0}
 
-        # Run the sensitivity analysis incrementally for storage cost values both larger and smaller than the optimal
-        for step_factor in [sensitivity_config["step_factor"], 1 / sensitivity_config["step_factor"]]:
-            # Set the first relative_storage_costs to the step factor
-            relative_storage_costs = step_factor
+        def run_curtailment_step(relative_storage_costs):
+            """
+            Run the optimization with the storage costs relative to the optimal storage costs and return the curtailment
+            """
+            step_key = f"{relative_storage_costs:.3f}"
+            status.header(f"Sensitivity run {step_key}")
 
-            while True:
-                step_key = f"{relative_storage_costs:.3f}"
-                st.subheader(f"Sensitivity run {step_key}")
+            # Add the step to the sensitivity config
+            sensitivity_config["steps"][step_key] = relative_storage_costs
 
-                # Add the step to the sensitivity config
-                sensitivity_config["steps"][step_key] = relative_storage_costs
+            # Set the total storage costs for this step
+            step_config = deepcopy(config)
+            storage_costs_step = {resolution: float(relative_storage_costs * optimal_storage_costs[resolution]) for resolution in optimal_storage_costs}
+            utils.set_nested_key(step_config, "fixed_storage.costs", storage_costs_step)
+            fixed_storage_costs_direction = "gte" if relative_storage_costs > 1 else "lte" if relative_storage_costs < 1 else None
+            utils.set_nested_key(step_config, "fixed_storage.direction", fixed_storage_costs_direction)
 
-                # Set the total storage costs for this step
-                step_config = deepcopy(config)
-                storage_costs_step = {resolution: float(relative_storage_costs * optimal_storage_costs[resolution]) for resolution in optimal_storage_costs}
-                utils.set_nested_key(step_config, "fixed_storage.costs", storage_costs_step)
-                fixed_storage_costs_direction = "gte" if step_factor > 1 else "lte" if step_factor < 1 else None
-                utils.set_nested_key(step_config, "fixed_storage.direction", fixed_storage_costs_direction)
+            # Run the optimization
+            output_directory_step = output_directory / step_key
+            run(step_config, status=status, output_directory=output_directory_step, is_sensitivity_step=True)
 
-                # Run the optimization
-                output_directory_step = output_directory / step_key
-                run(step_config, status=status, output_directory=output_directory_step)
+            # Calculate the curtailment
+            current_temporal_results = utils.get_temporal_results(output_directory_step, highest_resolution, group="all")
+            current_curtailment = current_temporal_results.curtailed_MW.sum() / current_temporal_results.production_total_MW.sum()
 
-                # Calculate the curtailment
-                current_temporal_results = utils.get_temporal_results(output_directory_step, highest_resolution, group="all")
-                current_curtailment = current_temporal_results.curtailed_MW.sum() / current_temporal_results.production_total_MW.sum()
+            # Send the notification
+            if config["send_notification"]:
+                utils.send_notification(f"Optimization {step_key} of '{config['name']}' has finished ({current_curtailment:.2%} curtailment)")
 
-                # Send the notification
-                if config["send_notification"]:
-                    utils.send_notification(f"Optimization {step_key} of '{config['name']}' has finished ({current_curtailment:.2%} curtailment)")
+            return current_curtailment
+
+        if sensitivity_config.get("search_method") == "root_finding":
+            # Find the relative storage costs for each target curtailment, the steps that are already solved are reused as brackets
+            optimal_temporal_results = utils.get_temporal_results(output_directory / "1.000", highest_resolution, group="all")
+            solved_steps = {1.0: optimal_temporal_results.curtailed_MW.sum() / optimal_temporal_results.production_total_MW.sum()}
+            for target_curtailment in sensitivity_config["curtailment_targets"]:
+                find_relative_storage_costs(target_curtailment, solved_steps, run_step=run_curtailment_step, step_factor=sensitivity_config["step_factor"], tolerance=sensitivity_config["curtailment_tolerance"])
+        else:
+            # Run the sensitivity analysis incrementally for storage cost values both larger and smaller than the optimal
+            for step_factor in [sensitivity_config["step_factor"], 1 / sensitivity_config["step_factor"]]:
+                # Set the first relative_storage_costs to the step factor
+                relative_storage_costs = step_factor
+
+                while True:
+                    current_curtailment = run_curtailment_step(relative_storage_costs)
 
-                # Break the while loop if the curtailment is out of bounds
-                curtailment_range = sensitivity_config["curtailment_range"]
-                if current_curtailment <= min(curtailment_range) or current_curtailment >= max(curtailment_range):
-                    break
+                    # Break the while loop if the curtailment is out of bounds
+                    curtailment_range = sensitivity_config["curtailment_range"]
+                    if current_curtailment <= min(curtailment_range) or current_curtailment >= max(curtailment_range):
+                        break
 
-                # Update the relative storage capacity for the next pass
-                relative_storage_costs *= step_factor
+                    # Update the relative storage capacity for the next pass
+                    relative_storage_costs *= step_factor
 
     # Otherwise run the general sensitivity analysis
     else:
-        # Loop over each sensitivity analysis step
+        # Build the model once per resolution and only update it in place for analysis types that don't change the structure of the model
+        parametric = sensitivity_config["analysis_type"] in ["baseload", "interconnection_capacity", "self_sufficiency"]
+
+        # Create the config for each step by changing the config parameters relevant for the current analysis type
+        step_configs = {}
         for step_key, step_value in sensitivity_config["steps"].items():
-            step_number = list(sensitivity_config["steps"].keys()).index(step_key) + 1
-            number_of_steps = len(sensitivity_config["steps"])
-            st.subheader(f"Sensitivity run {step_number}/{number_of_steps}")
             step_config = deepcopy(config)
-
-            # Change the config parameters relevant for the current analysis type for this step
             if sensitivity_config["analysis_type"] == "climate_years":
                 last_climate_year = utils.get_nested_key(step_config, "climate_years.end")
                 utils.set_nested_key(step_config, "climate_years.start", last_climate_year - (step_value - 1))
@@ -136,11 +221,22 @@ def run_sensitivity(config, sensitivity_config):
                 utils.set_nested_key(step_config, "interconnections.relative_capacity", step_value)
             elif sensitivity_config["analysis_type"] == "self_sufficiency":
                 utils.set_nested_key(step_config, "interconnections.min_self_sufficiency", step_value)
+            step_configs[step_key] = step_config
+
+        number_of_workers = min(sensitivity_config.get("parallel_steps", 1), len(step_configs))
+        if number_of_workers > 1:
+            _run_sensitivity_steps_in_parallel(step_configs, number_of_workers=number_of_workers, output_directory=output_directory, status=status, parametric=parametric)
+        else:
+            # Loop over each sensitivity analysis step
+            parametric_models = {} if parametric else None
+            for step_number, (step_key, step_config) in enumerate(step_configs.items(), start=1):
+                number_of_steps = len(step_configs)
+                status.header(f"Sensitivity run {step_number}/{number_of_steps}")
 
-            # Run the optimization
-            run(step_config, status=status, output_directory=output_directory / step_key)
-            if config["send_notification"]:
-                utils.send_notification(f"Optimization {step_number}/{number_of_steps} of '{config['name']}' has finished")
+                # Run the optimization
+                run(step_config, status=status, output_directory=output_directory / step_key, parametric_models=parametric_models, is_sensitivity_step=True)
+                if config["send_notification"]:
+                    utils.send_notification(f"Optimization {step_number}/{number_of_steps} of '{config['name']}' has finished")
 
     # Store the sensitivity config file
     utils.write_yaml(output_directory / "sensitivity.yaml", sensitivity_config)
@@ -0,0 +1,44 @@
+import argparse
+import pathlib
+
+import utils
+import validate
+
+from . import run, run_sensitivity
+from .status import ConsoleStatus
+
+
+def main():
+    """
+    Run the optimization or sensitivity analysis from the command line without the Streamlit interface
+    """
+    parser = argparse.ArgumentParser(prog="python -m optimization", description="Run the optimization without the Streamlit interface")
+    parser.add_argument("config", type=pathlib.Path, help="path to the config .yaml file")
+    parser.add_argument("--sensitivity", type=pathlib.Path, help="path to the sensitivity config .yaml file")
+    parser.add_argument("--name", help="name of the run, overrides the name in the config file")
+    parser.add_argument("--log-file", type=pathlib.Path, help="file to which the progress is written in addition to the console")
+    parser.add_argument("--quiet", action="store_true", help="don't show the solver log")
+    args = parser.parse_args()
+
+    # Read and validate the config files
+    config = utils.read_yaml(args.config)
+    if args.name is not None:
+        config["name"] = args.name
+    if not validate.is_config(config):
+        parser.error(f"'{args.config}' is not a valid config file")
+    sensitivity_config = utils.read_yaml(args.sensitivity) if args.sensitivity is not None else None
+    if sensitivity_config is not None and not validate.is_sensitivity_config(sensitivity_config):
+        parser.error(f"'{args.sensitivity}' is not a valid sensitivity config file")
+    if config["name"] in utils.get_previous_runs(include_uncompleted_runs=True):
+        parser.error(f"There is already a run called '{config['name']}'")
+
+    # Run the model with a status that writes to the console and optionally a log file
+    status = ConsoleStatus(log_filepath=args.log_file, show_solver_log=not args.quiet)
+    if sensitivity_config is not None:
+        run_sensitivity(config, sensitivity_config, status=status)
+    else:
+        run(config, status=status, output_directory=utils.path("output", config["name"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import gurobipy as gp
+import numpy as np
+import scipy.sparse as sp
+
+import validate
+
+
+def add_storage_block(model, *, timestamp_count, storage_assumptions, timestep_hours, energy_capacity, power_capacity, inflow_lb=0, outflow_lb=0, energy_stored_lb=0):
+    """
+    Add the inflow, outflow, and energy stored variables and their constraints for one storage technology as matrices
+    """
+    assert validate.is_model(model)
+    assert validate.is_integer(timestamp_count, min_value=1)
+    assert validate.is_dict(storage_assumptions)
+    assert validate.is_number(timestep_hours, min_value=0)
+    assert validate.is_variable(energy_capacity)
+    assert validate.is_variable(power_capacity)
+
+    efficiency = storage_assumptions["roundtrip_efficiency"] ** 0.5
+
+    # Create the state of charge, inflow, and outflow variables for all timestamps at once
+    energy_stored = model.addMVar(timestamp_count, lb=energy_stored_lb).tolist()
+    inflow = model.addMVar(timestamp_count, lb=inflow_lb).tolist()
+    outflow = model.addMVar(timestamp_count, lb=outflow_lb).tolist()
+
+    # The columns of the constraint matrices are ordered as [energy_stored, inflow, outflow, energy_capacity, power_capacity]
+    variables = energy_stored + inflow + outflow + [energy_capacity, power_capacity]
+    identity = sp.identity(timestamp_count, format="csr")
+    zeros = sp.csr_matrix((timestamp_count, timestamp_count))
+    ones = np.ones((timestamp_count, 1))
+
+    # Add the SOC constraint with regard to the previous timestamp (energy_stored[t] - energy_stored[t-1] - (inflow[t] * efficiency - outflow[t] / efficiency) * timestep_hours == 0)
+    if timestamp_count > 1:
+        next_timestamps = sp.eye(timestamp_count - 1, timestamp_count, k=1, format="csr")
+        previous_timestamps = sp.eye(timestamp_count - 1, timestamp_count, k=0, format="csr")
+        soc_matrix = sp.hstack([next_timestamps - previous_timestamps, -efficiency * timestep_hours * next_timestamps, timestep_hours / efficiency * next_timestamps, sp.csr_matrix((timestamp_count - 1, 2))])
+        model.addMConstr(soc_matrix, variables, gp.GRB.EQUAL, np.zeros(timestamp_count - 1))
+
+    # Ensure that the SOC of the first timestep equals the SOC of the last timestep
+    cyclic_matrix = sp.csr_matrix(([1.0, -1.0], ([0, 0], [0, timestamp_count - 1])), shape=(1, len(variables)))
+    model.addMConstr(cyclic_matrix, variables, gp.GRB.EQUAL, np.zeros(1))
+
+    # Add the energy capacity constraints (soc_min * energy_capacity <= energy_stored <= soc_max * energy_capacity)
+    soc_min_matrix = sp.hstack([identity, zeros, zeros, -storage_assumptions["soc_min"] * ones, np.zeros((timestamp_count, 1))])
+    model.addMConstr(soc_min_matrix, variables, gp.GRB.GREATER_EQUAL, np.zeros(timestamp_count))
+    soc_max_matrix = sp.hstack([identity, zeros, zeros, -storage_assumptions["soc_max"] * ones, np.zeros((timestamp_count, 1))])
+    model.addMConstr(soc_max_matrix, variables, gp.GRB.LESS_EQUAL, np.zeros(timestamp_count))
+
+    # Add the power capacity constraints (inflow <= power_capacity and outflow <= power_capacity)
+    inflow_matrix = sp.hstack([zeros, identity, zeros, np.zeros((timestamp_count, 1)), -ones])
+    model.addMConstr(inflow_matrix, variables, gp.GRB.LESS_EQUAL, np.zeros(timestamp_count))
+    outflow_matrix = sp.hstack([zeros, zeros, identity, np.zeros((timestamp_count, 1)), -ones])
+    model.addMConstr(outflow_matrix, variables, gp.GRB.LESS_EQUAL, np.zeros(timestamp_count))
+
+    # Return the variables per timestamp
+    return {"inflow": inflow, "outflow": outflow, "energy_stored": energy_stored}
@@ -0,0 +1,29 @@
+import scipy.sparse as sp
+
+import validate
+
+
+def create_incidence_matrix(bidding_zones, interconnections, *, config):
+    """
+    Create a sparse bidding zone x interconnection matrix with the net export of each bidding zone per MW of flow over the interconnection
+    """
+    assert validate.is_bidding_zone_list(bidding_zones)
+    assert validate.is_list_like(interconnections)
+    assert validate.is_config(config)
+
+    # Get the row index of each bidding zone
+    bidding_zone_indices = {bidding_zone: index for index, bidding_zone in enumerate(bidding_zones)}
+
+    # The exporting bidding zone sends the full flow, the importing bidding zone receives the flow multiplied by the efficiency
+    rows = []
+    columns = []
+    coefficients = []
+    for column, (connection_type, (from_bidding_zone, to_bidding_zone)) in enumerate(interconnections):
+        assert validate.is_interconnection_type(connection_type)
+
+        rows += [bidding_zone_indices[from_bidding_zone], bidding_zone_indices[to_bidding_zone]]
+        columns += [column, column]
+        coefficients += [1, -config["interconnections"]["efficiency"][connection_type]]
+
+    # Return the incidence matrix
+    return sp.csr_matrix((coefficients, (rows, columns)), shape=(len(bidding_zones), len(interconnections)))
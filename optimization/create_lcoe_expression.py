@@ -0,0 +1,76 @@
+import gurobipy as gp
+import numpy as np
+
+import utils
+import validate
+
+
+def _get_annualized_costs(config):
+    """
+    Return the annualized costs per MW of production capacity and per MWh and MW of storage capacity of each technology
+    """
+    assert validate.is_config(config)
+
+    # Calculate the annualized production costs per MW
+    production_technologies = config["technologies"]["production"]
+    production_crf = utils.technology_registry.get_parameter("production", "crf", list(production_technologies))
+    production_capex_per_MW = 1000 * utils.technology_registry.get_scenario_costs("production", "capex", production_technologies)
+    production_fixed_om_per_MW = 1000 * utils.technology_registry.get_scenario_costs("production", "fixed_om", production_technologies)
+    production_costs_per_MW = production_crf * production_capex_per_MW + production_fixed_om_per_MW
+
+    # Calculate the annualized storage costs per MWh of energy capacity and per MW of power capacity, the fixed O&M costs are a share of the capex
+    storage_technologies = config["technologies"]["storage"]
+    storage_crf = utils.technology_registry.get_parameter("storage", "crf", list(storage_technologies))
+    storage_fixed_om_share = utils.technology_registry.get_parameter("storage", "fixed_om", list(storage_technologies))
+    storage_energy_capex_per_MWh = 1000 * utils.technology_registry.get_scenario_costs("storage", "energy_capex", storage_technologies)
+    storage_power_capex_per_MW = 1000 * utils.technology_registry.get_scenario_costs("storage", "power_capex", storage_technologies)
+    storage_energy_costs_per_MWh = storage_crf * storage_energy_capex_per_MWh + storage_energy_capex_per_MWh * storage_fixed_om_share
+    storage_power_costs_per_MW = storage_crf * storage_power_capex_per_MW + storage_power_capex_per_MW * storage_fixed_om_share
+
+    return {"production": production_costs_per_MW.tolist(), "storage_energy": storage_energy_costs_per_MWh.tolist(), "storage_power": storage_power_costs_per_MW.tolist()}
+
+
+def create_lcoe_expression(production_expressions, storage_capacity, demand_per_bidding_zone, *, config, breakdown_level=0):
+    """
+    Create a linear expression of the average LCOE for all bidding zones with one annualized cost coefficient per capacity variable
+    """
+    assert validate.is_bidding_zone_dict(production_expressions)
+    assert validate.is_bidding_zone_dict(storage_capacity)
+    assert validate.is_dataframe(demand_per_bidding_zone, column_validator=validate.is_bidding_zone)
+    assert validate.is_config(config)
+    assert validate.is_breakdown_level(breakdown_level)
+
+    annualized_costs = _get_annualized_costs(config)
+
+    # Collect the capacity variables and their annualized costs per technology for all bidding zones
+    coefficients = {technology: [] for technology_type in ["production", "storage"] for technology in config["technologies"][technology_type]}
+    variables = {technology: [] for technology in coefficients}
+    for bidding_zone in demand_per_bidding_zone.columns:
+        for technology, costs_per_MW in zip(config["technologies"]["production"], annualized_costs["production"]):
+            production_variables = production_expressions[bidding_zone][technology]["variables"]
+            coefficients[technology] += [costs_per_MW] * len(production_variables)
+            variables[technology] += production_variables
+        for technology, energy_costs_per_MWh, power_costs_per_MW in zip(config["technologies"]["storage"], annualized_costs["storage_energy"], annualized_costs["storage_power"]):
+            coefficients[technology] += [energy_costs_per_MWh, power_costs_per_MW]
+            variables[technology] += [storage_capacity[bidding_zone].loc[technology, "energy"], storage_capacity[bidding_zone].loc[technology, "power"]]
+
+    # Group the technologies for the requested breakdown level
+    if breakdown_level == 0:
+        groups = {None: list(coefficients)}
+    if breakdown_level == 1:
+        groups = {technology_type: list(config["technologies"][technology_type]) for technology_type in ["production", "storage"]}
+    if breakdown_level == 2:
+        groups = {technology: [technology] for technology in coefficients}
+
+    # Create a single linear expression per group with the LCOE per MW or MWh of capacity as coefficients
+    annual_electricity_demand = utils.calculate_annual_demand(demand_per_bidding_zone)
+    expressions = {}
+    for group, technologies in groups.items():
+        group_coefficients = np.array([coefficient for technology in technologies for coefficient in coefficients[technology]], dtype="float64")
+        group_variables = [variable for technology in technologies for variable in variables[technology]]
+        expressions[group] = gp.LinExpr(utils.convert_annualized_costs_to_lcoe(group_coefficients, annual_electricity_demand).tolist(), group_variables)
+
+    # Return the expression, or a dictionary with an expression per group
+    if breakdown_level == 0:
+        return expressions[None]
+    return expressions
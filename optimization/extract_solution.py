@@ -0,0 +1,23 @@
+import numpy as np
+
+import validate
+
+
+def extract_solution(model, variable_groups):
+    """
+    Get the optimal values for all groups of variables with a single call and return them as NumPy arrays
+    """
+    assert validate.is_model(model)
+    assert validate.is_dict(variable_groups)
+
+    # Get the values of all variables at once
+    variables = [variable for variable_group in variable_groups.values() for variable in variable_group]
+    values = np.array(model.getAttr("X", variables)) if variables else np.array([])
+
+    # Split the values into an array per group of variables
+    solution = {}
+    offset = 0
+    for key, variable_group in variable_groups.items():
+        solution[key] = values[offset : offset + len(variable_group)]
+        offset += len(variable_group)
+    return solution
@@ -0,0 +1,61 @@
+import math
+
+import validate
+
+
+def _find_bracket(target_curtailment, solved_steps):
+    """
+    Return the two neighbouring solved relative storage costs between which the curtailment crosses the target, or None if there is no such pair
+    """
+    sorted_steps = sorted(solved_steps.items())
+    for (lower_costs, lower_curtailment), (upper_costs, upper_curtailment) in zip(sorted_steps[:-1], sorted_steps[1:]):
+        if (lower_curtailment - target_curtailment) * (upper_curtailment - target_curtailment) < 0:
+            return lower_costs, upper_costs
+    return None
+
+
+def find_relative_storage_costs(target_curtailment, solved_steps, *, run_step, step_factor, tolerance, max_iterations=10):
+    """
+    Find the relative storage costs that result in the target curtailment by bracketing and the secant method with bisection as fallback
+    """
+    assert validate.is_number(target_curtailment, min_value=0, max_value=1)
+    assert validate.is_dict(solved_steps) and len(solved_steps) > 0
+    assert validate.is_func(run_step)
+    assert validate.is_number(step_factor, min_value=1)
+    assert validate.is_number(tolerance, min_value=0)
+    assert validate.is_integer(max_iterations, min_value=1)
+
+    for iteration in range(max_iterations):
+        # Return the closest solved step if it is within the tolerance of the target
+        closest_costs = min(solved_steps, key=lambda relative_storage_costs: abs(solved_steps[relative_storage_costs] - target_curtailment))
+        if abs(solved_steps[closest_costs] - target_curtailment) <= tolerance:
+            return closest_costs
+
+        bracket = _find_bracket(target_curtailment, solved_steps)
+        if bracket is None:
+            # Expand the search range in the direction of the target when it is not bracketed by the solved steps yet (more storage results in less curtailment)
+            if all(curtailment > target_curtailment for curtailment in solved_steps.values()):
+                relative_storage_costs = max(solved_steps) * step_factor
+            else:
+                relative_storage_costs = min(solved_steps) / step_factor
+        else:
+            # Interpolate the logarithm of the relative storage costs linearly between the bracket (secant method)
+            lower_costs, upper_costs = bracket
+            lower_log, upper_log = math.log(lower_costs), math.log(upper_costs)
+            lower_error, upper_error = solved_steps[lower_costs] - target_curtailment, solved_steps[upper_costs] - target_curtailment
+            secant_log = lower_log - lower_error * (upper_log - lower_log) / (upper_error - lower_error)
+
+            # Use the midpoint instead if the secant step ends up close to the bracket boundaries, so the bracket keeps shrinking
+            margin = 0.1 * (upper_log - lower_log)
+            if not lower_log + margin <= secant_log <= upper_log - margin:
+                secant_log = (lower_log + upper_log) / 2
+            relative_storage_costs = math.exp(secant_log)
+
+        # Stop if the new step would be stored in the same directory as an existing step
+        if f"{relative_storage_costs:.3f}" in [f"{solved_costs:.3f}" for solved_costs in solved_steps]:
+            break
+
+        solved_steps[relative_storage_costs] = run_step(relative_storage_costs)
+
+    # Return the solved step that is closest to the target
+    return min(solved_steps, key=lambda relative_storage_costs: abs(solved_steps[relative_storage_costs] - target_curtailment))
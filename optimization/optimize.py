@@ -1,26 +1,93 @@
-import math
 from datetime import datetime, timedelta
 import gurobipy as gp
 import pandas as pd
-import re
-import streamlit as st
+import numpy as np
+import scipy.sparse as sp
 
 import utils
 import validate
 
+from .add_storage_block import add_storage_block
+from .create_incidence_matrix import create_incidence_matrix
+from .create_lcoe_expression import create_lcoe_expression
+from .extract_solution import extract_solution
+from .profiler import Profiler
+from .read_previous_solution import read_previous_solution
+from .solver_progress import SolverProgress
 
-def optimize(config, *, resolution, previous_resolution, status, output_directory):
+
+def _sum_rows(coefficients, variables):
+    """
+    Return a linear expression of the sum of all rows in a coefficient matrix
     """
-    Create and run the model
+    column_sums = np.asarray(coefficients.sum(axis=0)).ravel()
+    nonzero_columns = np.flatnonzero(column_sums)
+    return gp.LinExpr(column_sums[nonzero_columns].tolist(), [variables[column] for column in nonzero_columns])
+
+
+def _set_previous_solution(model, variable_groups, previous_solution, *, config):
+    """
+    Set the lower bounds and optionally the start values of the variables based on the solution of the previous resolution
+    """
+    assert validate.is_model(model)
+    assert validate.is_dict(variable_groups)
+    assert validate.is_dict(previous_solution)
+    assert validate.is_config(config)
+
+    # Set the lower bounds of the capacities, flows, and state of charge as a share of the previous values (the export flows don't get a lower bound)
+    capacity_propagation = config["time_discretization"]["capacity_propagation"]
+    soc_propagation = config["time_discretization"]["soc_propagation"]
+    propagation = {"production": capacity_propagation, "storage_capacity": capacity_propagation, "inflow": soc_propagation, "outflow": soc_propagation, "energy_stored": soc_propagation}
+    for key, variables in variable_groups.items():
+        if key != "export":
+            model.setAttr("LB", variables, (propagation[key[1]] * previous_solution[key]).tolist())
+
+    # Use the previous values as start values, the method that uses them is set in _set_solver_settings
+    if config["time_discretization"].get("warm_start", False):
+        for key, variables in variable_groups.items():
+            model.setAttr("PStart", variables, np.nan_to_num(previous_solution[key], nan=gp.GRB.UNDEFINED).tolist())
+
+
+def _set_solver_settings(instance, config, *, is_warm_start, is_update):
+    """
+    Set the method and the related start and barrier parameters of the model and return the method
+    """
+    assert validate.is_dict(instance)
+    assert validate.is_config(config)
+    assert validate.is_bool(is_warm_start)
+    assert validate.is_bool(is_update)
+
+    model = instance["model"]
+    is_last_resolution = instance["is_last_resolution"]
+
+    # Use the configured method, unless another method is configured for warm-started stages, and the dual simplex method for an updated model to start from the optimal basis of the previous step
+    if is_update:
+        method = 1
+    elif is_warm_start:
+        method = config["time_discretization"].get("warm_start_method", config["optimization"]["method"])
+    else:
+        method = config["optimization"]["method"]
+    model.setParam("Method", method)
+
+    # Let the presolver use the start values of a warm start, ignore the start values of a cold solve, and keep using the basis of an updated model
+    model.setParam("LPWarmStart", 2 if is_warm_start else 1 if is_update else 0)
+
+    # Disable crossover for the last resolution, a parametric model requires a basis to warm start the next step
+    model.setParam("Crossover", 0 if is_last_resolution and not instance["is_parametric"] else -1)
+    model.setParam("BarConvTol", 10 ** -8 * instance["objective_scale_factor"] if is_last_resolution else 10 ** -8)
+    return method
+
+
+def _build_model(config, *, resolution, previous_resolution, status, output_directory, parametric, thread_count, profiler):
+    """
+    Create the model and return it together with the variables and constraints that are required to update, solve, and store it
     """
     assert validate.is_config(config)
     assert validate.is_resolution(resolution)
     assert validate.is_resolution(previous_resolution, required=False)
     assert validate.is_directory_path(output_directory)
-
-    # Create a dictionary to store the run duration of the different phases
-    duration = {}
-    initializing_start = datetime.now()
+    assert validate.is_bool(parametric)
+    assert validate.is_integer(thread_count, min_value=1, required=False)
 
     """
     Step 1: Create the model and set the parameters
@@ -29,27 +96,31 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
     model.setParam("OutputFlag", 0)
 
     # Set the user defined parameters
-    model.setParam("Threads", config["optimization"]["thread_count"])
-    model.setParam("Method", config["optimization"]["method"])
+    model.setParam("Threads", thread_count or config["optimization"]["thread_count"])
 
-    # Disable crossover for the last resolution and set BarHomogeneous and Aggregate
+    # Set BarHomogeneous and Aggregate, the method and the crossover are set in _set_solver_settings before each solve
     objective_scale_factor = 10 ** 6
     is_last_resolution = resolution == utils.get_sorted_resolution_stages(config, descending=True)[-1]
-    model.setParam("Crossover", 0 if is_last_resolution else -1)
-    model.setParam("BarConvTol", 10 ** -8 * objective_scale_factor if is_last_resolution else 10 ** -8)
     model.setParam("BarHomogeneous", 1)  # Don't know what this does, but it speeds up some more complex models
     model.setParam("Aggregate", 0)  # Don't know what this does, but it speeds up some more complex models
     model.setParam("Presolve", 2)  # Use an aggressive presolver
 
+    # Load the climate zones of each bidding zone once for the whole run
+    climate_zone_index = utils.get_climate_zone_index(config["model_year"], utils.get_bidding_zones_for_countries(config["country_codes"]))
+    profiler.lap("1")
+
     """
     Step 2: Initialize each bidding zone
     """
     # Create dictionaries to store all the data per bidding zone
     temporal_data = {}
     temporal_results = {}
-    temporal_export = {}
+    temporal_export = {"hvac": {}, "hvdc": {}}
     production_capacity = {}
+    production_expressions = {}
     storage_capacity = {}
+    storage_flows = {}
+    export_limits = {"hvac": {}, "hvdc": {}}
 
     bidding_zones = utils.get_bidding_zones_for_countries(config["country_codes"])
     for index, bidding_zone in enumerate(bidding_zones):
@@ -73,143 +144,56 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
 
         # Create a DataFrame for the production capacities
         production_capacity[bidding_zone] = pd.DataFrame(columns=config["technologies"]["production"])
-
-        if previous_resolution:
-            # Get the temporal results from the previous run
-            previous_temporal_results = utils.read_csv(output_directory / previous_resolution / "temporal_results" / f"{bidding_zone}.csv", parse_dates=True, index_col=0)
-            # Resample the previous results so it has the same timestamps as the current step
-            previous_temporal_results = previous_temporal_results.resample(resolution).mean()
-            # Find and add the rows that are missing in the previous results (the resample method does not add rows after the last timestamp)
-            for timestamp in temporal_results[bidding_zone].index.difference(previous_temporal_results.index):
-                previous_temporal_results.loc[timestamp] = pd.Series([], dtype="float64")  # Sets None to all columns in the new row
-            # Remove all rows that are in previous_temporal_results but not in the new temporal_results DataFrame (don't know why this happens, but it happens sometimes)
-            previous_temporal_results = previous_temporal_results[previous_temporal_results.index.isin(temporal_results[bidding_zone].index)]
-            # Interpolate the empty rows for the energy stored columns created by the resample method
-            previous_energy_stored_columns = previous_temporal_results.filter(regex="energy_stored_.+_MWh", axis=1)
-            relative_resolution = math.ceil(pd.Timedelta(previous_resolution) / pd.Timedelta(resolution))
-            previous_energy_stored_columns = previous_energy_stored_columns.interpolate().shift(relative_resolution - 1, axis=0).fillna(0)
-            previous_temporal_results[previous_energy_stored_columns.columns] = previous_energy_stored_columns
-            # Fill the empty rows created by the resample method by the value from the previous rows
-            previous_temporal_results = previous_temporal_results.ffill()
-            # Remove the leap days from the dataset that could have been introduced by the resample method
-            previous_temporal_results = previous_temporal_results[~((previous_temporal_results.index.month == 2) & (previous_temporal_results.index.day == 29))]
-
-        # Create empty DataFrames for the interconnections, if they don't exist yet
-        if not len(temporal_export):
-            temporal_export_columns = pd.MultiIndex.from_tuples([], names=["from", "to"])
-            temporal_export["hvac"] = pd.DataFrame(index=temporal_results[bidding_zone].index, columns=temporal_export_columns)
-            temporal_export["hvdc"] = pd.DataFrame(index=temporal_results[bidding_zone].index, columns=temporal_export_columns)
+        profiler.lap("2A", bidding_zone=bidding_zone)
 
         """
         Step 2B: Define production capacity variables
         """
-        temporal_results[bidding_zone]["production_total_MW"] = 0
+        production_expressions[bidding_zone] = {}
         for production_technology in config["technologies"]["production"]:
             status.update(f"{country_flag} Adding {utils.format_technology(production_technology, capitalize=False)} production")
 
             # Create a capacity variable for each climate zone
-            climate_zones = [re.match(f"{production_technology}_(.+)_cf", column).group(1) for column in temporal_data[bidding_zone].columns if column.startswith(f"{production_technology}_")]
+            climate_zones = [climate_zone["climate_zone"] for climate_zone in climate_zone_index[bidding_zone]["climate_zones"].get(production_technology, [])]
             production_potential = utils.get_production_potential_in_climate_zone(bidding_zone, production_technology, config=config)
-            if previous_resolution:
-                previous_production_capacity = utils.read_csv(output_directory / previous_resolution / "production_capacities" / f"{bidding_zone}.csv", index_col=0)
-                capacities = model.addVars(climate_zones, lb=config["time_discretization"]["capacity_propagation"] * previous_production_capacity[production_technology].dropna(), ub=production_potential)
-            else:
-                capacities = model.addVars(climate_zones, ub=production_potential)
-
-            # Add the capacities to the production_capacity DataFrame and calculate the temporal production for a specific technology
-            temporal_production = 0
+            capacities = model.addVars(climate_zones, ub=production_potential)
+
+            # Add the capacities to the production_capacity DataFrame
             for climate_zone, capacity in capacities.items():
                 production_capacity[bidding_zone].loc[climate_zone, production_technology] = capacity
-                # Apply is required, otherwise it will throw a ValueError if there are more than a few thousand rows (see https://stackoverflow.com/questions/64801287)
-                temporal_production += temporal_data[bidding_zone][f"{production_technology}_{climate_zone}_cf"].apply(lambda cf: cf * capacity)
-            temporal_results[bidding_zone][f"production_{production_technology}_MW"] = temporal_production
-            temporal_results[bidding_zone]["production_total_MW"] += temporal_production
+
+            # Store the production as the capacity factor matrix (timestamps x climate zones) multiplied by the capacity vector
+            capacity_factor_columns = [f"{production_technology}_{climate_zone}_cf" for climate_zone in climate_zones]
+            production_expressions[bidding_zone][production_technology] = {
+                "coefficients": sp.csr_matrix(temporal_data[bidding_zone][capacity_factor_columns].to_numpy()),
+                "variables": [capacities[climate_zone] for climate_zone in climate_zones],
+            }
+        profiler.lap("2B", bidding_zone=bidding_zone)
 
         """
         Step 2C: Define storage variables and constraints
         """
         # Create a DataFrame for the storage capacity in this bidding zone
         storage_capacity[bidding_zone] = pd.DataFrame(0, index=config["technologies"]["storage"], columns=["energy", "power"])
-
-        # Create an object to save the storage capacity (energy & power) and add 2 columns to the results DataFrame
-        temporal_results[bidding_zone]["net_storage_flow_total_MW"] = 0
-        temporal_results[bidding_zone]["energy_stored_total_MWh"] = 0
+        storage_flows[bidding_zone] = {}
 
         # Add the variables and constraints for all storage technologies
         for storage_technology in config["technologies"]["storage"]:
             status.update(f"{country_flag} Adding {utils.format_technology(storage_technology, capitalize=False)} storage")
 
             # Get the specific storage assumptions
-            storage_assumptions = utils.read_yaml(utils.path("input", "technologies", "storage.yaml"))[storage_technology]
-            efficiency = storage_assumptions["roundtrip_efficiency"] ** 0.5
+            storage_assumptions = utils.technology_registry.get_assumptions("storage", storage_technology)
             timestep_hours = pd.Timedelta(resolution).total_seconds() / 3600
 
             # Create a variable for the energy and power storage capacity
-            if previous_resolution:
-                previous_storage_capacity = utils.read_csv(output_directory / previous_resolution / "storage_capacities" / f"{bidding_zone}.csv", index_col=0)
-                storage_capacity[bidding_zone].loc[storage_technology, "energy"] = model.addVar(lb=config["time_discretization"]["capacity_propagation"] * previous_storage_capacity.loc[storage_technology, "energy"])
-                storage_capacity[bidding_zone].loc[storage_technology, "power"] = model.addVar(lb=config["time_discretization"]["capacity_propagation"] * previous_storage_capacity.loc[storage_technology, "power"])
-            else:
-                storage_capacity[bidding_zone].loc[storage_technology, "energy"] = model.addVar()
-                storage_capacity[bidding_zone].loc[storage_technology, "power"] = model.addVar()
-
-            # Create the inflow and outflow variables
-            if previous_resolution:
-                inflow = model.addVars(temporal_data[bidding_zone].index, lb=config["time_discretization"]["soc_propagation"] * previous_temporal_results[f"net_storage_flow_{storage_technology}_MW"].clip(lower=0))
-                outflow = model.addVars(temporal_data[bidding_zone].index, lb=config["time_discretization"]["soc_propagation"] * -previous_temporal_results[f"net_storage_flow_{storage_technology}_MW"].clip(upper=0))
-            else:
-                inflow = model.addVars(temporal_data[bidding_zone].index)
-                outflow = model.addVars(temporal_data[bidding_zone].index)
-
-            # Add the net storage flow variables to the temporal_results DataFrame
-            net_flow = pd.Series(data=[inflow_value - outflow_value for inflow_value, outflow_value in zip(inflow.values(), outflow.values())], index=temporal_results[bidding_zone].index)
-            temporal_results[bidding_zone][f"net_storage_flow_{storage_technology}_MW"] = net_flow
-            temporal_results[bidding_zone]["net_storage_flow_total_MW"] += net_flow
-
-            # Create the energy stored column for this storage technology in the temporal_results DataFrame
-            temporal_results[bidding_zone][f"energy_stored_{storage_technology}_MWh"] = None
-
-            # Unpack the energy and power capacities for this storage technology
+            storage_capacity[bidding_zone].loc[storage_technology, "energy"] = model.addVar()
+            storage_capacity[bidding_zone].loc[storage_technology, "power"] = model.addVar()
+
+            # Add the inflow, outflow, and energy stored variables and the SOC, energy capacity, and power capacity constraints
             energy_capacity = storage_capacity[bidding_zone].loc[storage_technology, "energy"]
             power_capacity = storage_capacity[bidding_zone].loc[storage_technology, "power"]
-
-            # Loop over all hours
-            energy_stored_previous = None
-            temporal_energy_stored_dict = {}
-            for timestamp in temporal_data[bidding_zone].index:
-                # Create the state of charge variables
-                if previous_resolution:
-                    energy_stored_current = model.addVar(lb=config["time_discretization"]["soc_propagation"] * previous_temporal_results.loc[timestamp, f"energy_stored_{storage_technology}_MWh"])
-                else:
-                    energy_stored_current = model.addVar()
-
-                # Add the SOC constraint with regard to the previous timestamp
-                if energy_stored_previous:
-                    model.addConstr(energy_stored_current == energy_stored_previous + (inflow[timestamp] * efficiency - outflow[timestamp] / efficiency) * timestep_hours)
-
-                # Add the energy capacity constraints (can't be added when the flow variables are defined because it's a gurobipy.Var)
-                model.addConstr(energy_stored_current >= storage_assumptions["soc_min"] * energy_capacity)
-                model.addConstr(energy_stored_current <= storage_assumptions["soc_max"] * energy_capacity)
-
-                # Add the power capacity constraints (can't be added when the flow variables are defined because it's a gurobipy.Var)
-                model.addConstr(inflow[timestamp] <= power_capacity)
-                model.addConstr(outflow[timestamp] <= power_capacity)
-
-                # Add the current energy stored to temporal_energy_stored_dict
-                temporal_energy_stored_dict[timestamp] = energy_stored_current
-
-                # Update energy_stored_previous
-                energy_stored_previous = energy_stored_current
-
-            # Convert the temporal_energy_stored_dict to a Series
-            temporal_energy_stored = pd.Series(data=temporal_energy_stored_dict)
-
-            # Ensure that the SOC of the first timestep equals the SOC of the last timestep
-            model.addConstr(temporal_energy_stored.head(1).item() == temporal_energy_stored.tail(1).item())
-
-            # Add the temporal energy stored to the temporal_results DataFrame
-            temporal_results[bidding_zone][f"energy_stored_{storage_technology}_MWh"] = temporal_energy_stored
-            temporal_results[bidding_zone]["energy_stored_total_MWh"] += temporal_energy_stored
+            storage_flows[bidding_zone][storage_technology] = add_storage_block(model, timestamp_count=len(temporal_data[bidding_zone].index), storage_assumptions=storage_assumptions, timestep_hours=timestep_hours, energy_capacity=energy_capacity, power_capacity=power_capacity)
+        profiler.lap("2C", bidding_zone=bidding_zone)
 
         """
         Step 2D: Define the interconnection variables
@@ -218,60 +202,62 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
             status.update(f"{country_flag} Adding {connection_type.upper()} interconnections")
             # Get the export limits
             temporal_export_limits = utils.get_export_limits(bidding_zone, connection_type=connection_type, index=temporal_results[bidding_zone].index, config=config)
-            # Multiply the export limits with the relative capacity factor
-            temporal_export_limits *= config["interconnections"]["relative_capacity"]
-            # Create the variables for the export variables
-            temporal_export[connection_type] = temporal_export_limits.apply(lambda column: pd.Series(model.addVars(temporal_export[connection_type].index, ub=temporal_export_limits[column.name])))
+            # Create the export flow variables for each interconnection from this bidding zone with the export limits multiplied by the relative capacity factor as upper bound
+            for interconnection, interconnection_export_limits in temporal_export_limits.items():
+                export_limits[connection_type][interconnection] = interconnection_export_limits.to_numpy()
+                temporal_export[connection_type][interconnection] = model.addMVar(len(interconnection_export_limits.index), ub=export_limits[connection_type][interconnection] * config["interconnections"]["relative_capacity"]).tolist()
+        profiler.lap("2D", bidding_zone=bidding_zone)
+
+    # Group the variables that are stored after the optimization, all variables of a group are retrieved as one array
+    interconnections = [(connection_type, interconnection) for connection_type in temporal_export for interconnection in temporal_export[connection_type]]
+    variable_groups = {"export": [variable for connection_type, interconnection in interconnections for variable in temporal_export[connection_type][interconnection]]}
+    for bidding_zone in bidding_zones:
+        for production_technology, production_expression in production_expressions[bidding_zone].items():
+            variable_groups[bidding_zone, "production", production_technology] = production_expression["variables"]
+        for storage_technology, flows in storage_flows[bidding_zone].items():
+            for flow_type in ["inflow", "outflow", "energy_stored"]:
+                variable_groups[bidding_zone, flow_type, storage_technology] = flows[flow_type]
+        variable_groups[bidding_zone, "storage_capacity"] = storage_capacity[bidding_zone][["energy", "power"]].to_numpy().ravel().tolist()
 
     """
-    Step 3: Define demand constraints
+    Step 2E: Propagate the solution of the previous resolution
     """
-    for bidding_zone in bidding_zones:
-        country_flag = utils.get_country_property(utils.get_country_of_bidding_zone(bidding_zone), "flag")
-        status.update(f"{country_flag} Adding demand constraints")
-
-        # Create a dictionary to keep track of the net export per interconnection type
-        net_export_per_interconnection_type = {interconnection_type: 0 for interconnection_type in temporal_export}
-
-        # Add a column for the temporal export to each country
-        for interconnection_type in temporal_export:
-            relevant_temporal_export = [interconnection_bidding_zones for interconnection_bidding_zones in temporal_export[interconnection_type] if bidding_zone in interconnection_bidding_zones]
-            for bidding_zone1, bidding_zone2 in relevant_temporal_export:
-                # Calculate the export flow
-                direction = 1 if bidding_zone1 == bidding_zone else -config["interconnections"]["efficiency"][interconnection_type]
-                export_flow = direction * temporal_export[interconnection_type][bidding_zone1, bidding_zone2]
-
-                # Add the export flow to the interconnection type dictionary
-                net_export_per_interconnection_type[interconnection_type] += export_flow
-
-                # Add the export flow to the relevant bidding zone column
-                other_bidding_zone = bidding_zone1 if bidding_zone2 == bidding_zone else bidding_zone2
-                column_name = f"net_export_{other_bidding_zone}_MW"
-                if column_name not in temporal_results:
-                    temporal_results[bidding_zone][column_name] = 0
-                temporal_results[bidding_zone][column_name] += export_flow
-
-        # Add a column for each of the interconnection types
-        for interconnection_type in net_export_per_interconnection_type:
-            temporal_results[bidding_zone][f"net_export_{interconnection_type}_MW"] = net_export_per_interconnection_type[interconnection_type]
-
-        # Add a column for the total temporal export
-        temporal_results[bidding_zone]["net_export_MW"] = 0
-        for column_name in temporal_results[bidding_zone]:
-            if re.search("^net_export_[A-Z]{2}[0-9a-zA-Z]{2}_MW$", column_name):
-                temporal_results[bidding_zone]["net_export_MW"] += temporal_results[bidding_zone][column_name]
+    if previous_resolution:
+        status.update("Propagating the results of the previous resolution")
+        previous_solution = read_previous_solution(bidding_zones, interconnections, temporal_results[bidding_zones[0]].index, config=config, resolution=resolution, previous_resolution=previous_resolution, output_directory=output_directory)
+        _set_previous_solution(model, variable_groups, previous_solution, config=config)
+    profiler.lap("2E")
 
-        # Add the demand constraint
-        temporal_results[bidding_zone].apply(lambda row: model.addConstr(row.baseload_MW + row.production_total_MW - row.net_storage_flow_total_MW - row.net_export_MW >= row.demand_MW), axis=1)
-
-        # Calculate the curtailed energy per hour
-        curtailed_MW = temporal_results[bidding_zone].baseload_MW + temporal_results[bidding_zone].production_total_MW - temporal_results[bidding_zone].demand_MW - temporal_results[bidding_zone].net_storage_flow_total_MW - temporal_results[bidding_zone].net_export_MW
-        temporal_results[bidding_zone].insert(temporal_results[bidding_zone].columns.get_loc("production_total_MW"), "curtailed_MW", curtailed_MW)
+    """
+    Step 3: Define demand constraints
+    """
+    status.update("Adding demand constraints")
+
+    # Create the incidence matrix of the interconnection network
+    incidence_matrix = create_incidence_matrix(bidding_zones, interconnections, config=config)
+
+    # Create the coefficient matrices (bidding zones x timestamps rows) and variables for the production, net storage flow, and net export
+    timestamp_count = len(temporal_results[bidding_zones[0]].index)
+    identity = sp.identity(timestamp_count, format="csr")
+    production_coefficients = sp.block_diag([sp.hstack([production_expression["coefficients"] for production_expression in production_expressions[bidding_zone].values()]) for bidding_zone in bidding_zones], format="csr")
+    production_variables = [variable for bidding_zone in bidding_zones for production_expression in production_expressions[bidding_zone].values() for variable in production_expression["variables"]]
+    storage_coefficients = sp.block_diag([sp.hstack([identity, -identity] * len(storage_flows[bidding_zone])) for bidding_zone in bidding_zones], format="csr")
+    storage_variables = [variable for bidding_zone in bidding_zones for flows in storage_flows[bidding_zone].values() for variable in flows["inflow"] + flows["outflow"]]
+    export_coefficients = sp.kron(incidence_matrix, identity, format="csr")
+    export_variables = variable_groups["export"]
+
+    # Add the demand constraints for all bidding zones and timestamps (baseload + production - net storage flow - net export >= demand)
+    supply_coefficients = sp.hstack([production_coefficients, -storage_coefficients, -export_coefficients], format="csr")
+    net_demand = np.concatenate([(temporal_results[bidding_zone].demand_MW - temporal_results[bidding_zone].baseload_MW).to_numpy() for bidding_zone in bidding_zones])
+    demand_constraints = model.addMConstr(supply_coefficients, production_variables + storage_variables + export_variables, gp.GRB.GREATER_EQUAL, net_demand).tolist()
+    profiler.lap("3")
 
     """
     Step 4: Define the self-sufficiency constraints per country
     """
-    if config["interconnections"]["min_self_sufficiency"] > 0:
+    # A parametric model always gets the constraints, so the minimum self-sufficiency can be changed in later steps
+    self_sufficiency_constraints = {}
+    if config["interconnections"]["min_self_sufficiency"] > 0 or parametric:
         for country_code in config["country_codes"]:
             country_flag = utils.get_country_property(country_code, "flag")
             status.update(f"{country_flag} Adding self-sufficiency constraint")
@@ -285,16 +271,27 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
 
             # Loop over all bidding zones in the country
             for bidding_zone in utils.get_bidding_zones_for_countries([country_code]):
-                # Calculate the total demand and non-curtailed production in this country
-                sum_demand += temporal_results[bidding_zone].demand_MW.sum()
-                sum_baseload += temporal_results[bidding_zone].baseload_MW.sum()
-                sum_production += temporal_results[bidding_zone].production_total_MW.sum()
-                sum_curtailed += temporal_results[bidding_zone].curtailed_MW.sum()
-                sum_storage_flow += temporal_results[bidding_zone].net_storage_flow_total_MW.sum()
+                # Calculate the total production, net storage flow, and net export from the rows of this bidding zone in the coefficient matrices
+                bidding_zone_rows = slice(bidding_zones.index(bidding_zone) * timestamp_count, (bidding_zones.index(bidding_zone) + 1) * timestamp_count)
+                sum_production_bidding_zone = _sum_rows(production_coefficients[bidding_zone_rows], production_variables)
+                sum_storage_flow_bidding_zone = _sum_rows(storage_coefficients[bidding_zone_rows], storage_variables)
+                sum_net_export_bidding_zone = _sum_rows(export_coefficients[bidding_zone_rows], export_variables)
 
-            # Add the self-sufficiency constraint
+                # Calculate the total demand and non-curtailed production in this country
+                sum_demand_bidding_zone = temporal_results[bidding_zone].demand_MW.sum()
+                sum_baseload_bidding_zone = temporal_results[bidding_zone].baseload_MW.sum()
+                sum_demand += sum_demand_bidding_zone
+                sum_baseload += sum_baseload_bidding_zone
+                sum_production += sum_production_bidding_zone
+                sum_curtailed += sum_baseload_bidding_zone + sum_production_bidding_zone - sum_demand_bidding_zone - sum_storage_flow_bidding_zone - sum_net_export_bidding_zone
+                sum_storage_flow += sum_storage_flow_bidding_zone
+
+            # Add the self-sufficiency constraint (a minimum self-sufficiency of 0 is stored as an unbounded right-hand side)
+            self_sufficiency = (sum_baseload + sum_production - sum_curtailed - sum_storage_flow) / sum_demand
             min_self_sufficiency = config["interconnections"]["min_self_sufficiency"]
-            model.addConstr((sum_baseload + sum_production - sum_curtailed - sum_storage_flow) / sum_demand >= min_self_sufficiency)
+            self_sufficiency_constraint = model.addLConstr(self_sufficiency, gp.GRB.GREATER_EQUAL, min_self_sufficiency if min_self_sufficiency > 0 else -gp.GRB.INFINITY)
+            self_sufficiency_constraints[country_code] = {"constraint": self_sufficiency_constraint, "constant": self_sufficiency.getConstant()}
+    profiler.lap("4")
 
     """
     Step 5: Define the storage costs constraint
@@ -304,7 +301,7 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
 
         # Calculate the storage costs
         temporal_net_demand = utils.merge_dataframes_on_column(temporal_results, "demand_MW") - utils.merge_dataframes_on_column(temporal_results, "baseload_MW")
-        storage_costs = utils.calculate_lcoe(production_capacity, storage_capacity, temporal_net_demand, config=config, breakdown_level=1)["storage"]
+        storage_costs = create_lcoe_expression(production_expressions, storage_capacity, temporal_net_demand, config=config, breakdown_level=1)["storage"]
 
         # Add a constraint so the storage costs are either smaller or larger than the fixed storage costs
         fixed_storage_costs = config["fixed_storage"]["costs"][resolution]
@@ -312,18 +309,109 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
             model.addConstr(storage_costs >= fixed_storage_costs)
         elif config["fixed_storage"]["direction"] == "lte":
             model.addConstr(storage_costs <= fixed_storage_costs)
+    profiler.lap("5")
 
     """
     Step 6: Set objective function
     """
     status.update("Setting the objective function")
     temporal_net_demand = utils.merge_dataframes_on_column(temporal_results, "demand_MW") - utils.merge_dataframes_on_column(temporal_results, "baseload_MW")
-    firm_lcoe = utils.calculate_lcoe(production_capacity, storage_capacity, temporal_net_demand, config=config)
+    firm_lcoe = create_lcoe_expression(production_expressions, storage_capacity, temporal_net_demand, config=config)
     model.setObjective(firm_lcoe * objective_scale_factor, gp.GRB.MINIMIZE)
+    profiler.lap("6")
+
+    # Return the model and everything that is required to update, solve, and store it
+    return {
+        "model": model,
+        "objective_scale_factor": objective_scale_factor,
+        "is_last_resolution": is_last_resolution,
+        "is_parametric": parametric,
+        "bidding_zones": bidding_zones,
+        "timestamp_count": timestamp_count,
+        "temporal_results": temporal_results,
+        "production_expressions": production_expressions,
+        "production_capacity": production_capacity,
+        "storage_capacity": storage_capacity,
+        "storage_flows": storage_flows,
+        "temporal_export": temporal_export,
+        "export_limits": export_limits,
+        "interconnections": interconnections,
+        "incidence_matrix": incidence_matrix,
+        "variable_groups": variable_groups,
+        "demand_constraints": demand_constraints,
+        "self_sufficiency_constraints": self_sufficiency_constraints,
+    }
+
+
+def _update_model(instance, config, *, resolution, previous_resolution, status, output_directory, profiler):
+    """
+    Update the baseload, interconnection capacity, minimum self-sufficiency, and propagated results of an existing model in place
+    """
+    assert validate.is_dict(instance)
+    assert validate.is_config(config)
+    assert validate.is_resolution(resolution)
+    assert validate.is_resolution(previous_resolution, required=False)
+    assert validate.is_directory_path(output_directory)
 
-    # Add the initializing duration to the dictionary
-    initializing_end = datetime.now()
-    duration["initializing"] = round((initializing_end - initializing_start).total_seconds())
+    model = instance["model"]
+    bidding_zones = instance["bidding_zones"]
+    temporal_results = instance["temporal_results"]
+
+    # Update the baseload and the right-hand side of the demand constraints
+    status.update("Updating the baseload")
+    previous_net_demand = sum((temporal_results[bidding_zone].demand_MW - temporal_results[bidding_zone].baseload_MW).sum() for bidding_zone in bidding_zones)
+    for bidding_zone in bidding_zones:
+        temporal_results[bidding_zone]["baseload_MW"] = temporal_results[bidding_zone].demand_MW.mean() * config["technologies"]["relative_baseload"]
+    net_demand = np.concatenate([(temporal_results[bidding_zone].demand_MW - temporal_results[bidding_zone].baseload_MW).to_numpy() for bidding_zone in bidding_zones])
+    model.setAttr("RHS", instance["demand_constraints"], net_demand.tolist())
+
+    # Scale the objective, since the LCOE is calculated relative to the net demand
+    variables = model.getVars()
+    model.setAttr("Obj", variables, (np.array(model.getAttr("Obj", variables)) * previous_net_demand / net_demand.sum()).tolist())
+
+    # Update the upper bounds of the export flows
+    status.update("Updating the interconnection capacity")
+    for connection_type, interconnection in instance["interconnections"]:
+        export_limits = instance["export_limits"][connection_type][interconnection] * config["interconnections"]["relative_capacity"]
+        model.setAttr("UB", instance["temporal_export"][connection_type][interconnection], export_limits.tolist())
+
+    # Update the right-hand side of the self-sufficiency constraints
+    status.update("Updating the self-sufficiency constraints")
+    min_self_sufficiency = config["interconnections"]["min_self_sufficiency"]
+    for self_sufficiency_constraint in instance["self_sufficiency_constraints"].values():
+        self_sufficiency_constraint["constraint"].RHS = min_self_sufficiency - self_sufficiency_constraint["constant"] if min_self_sufficiency > 0 else -gp.GRB.INFINITY
+
+    # Update the lower bounds and start values with the solution of the previous resolution of this step
+    if previous_resolution:
+        status.update("Propagating the results of the previous resolution")
+        previous_solution = read_previous_solution(bidding_zones, instance["interconnections"], temporal_results[bidding_zones[0]].index, config=config, resolution=resolution, previous_resolution=previous_resolution, output_directory=output_directory)
+        _set_previous_solution(model, instance["variable_groups"], previous_solution, config=config)
+    profiler.lap("update")
+
+
+def _solve_model(instance, config, *, resolution, status, output_directory, measure_warm_start, profiler):
+    """
+    Solve the model and store the results
+    """
+    assert validate.is_dict(instance)
+    assert validate.is_config(config)
+    assert validate.is_resolution(resolution)
+    assert validate.is_directory_path(output_directory)
+    assert validate.is_bool(measure_warm_start)
+
+    model = instance["model"]
+    objective_scale_factor = instance["objective_scale_factor"]
+    bidding_zones = instance["bidding_zones"]
+    timestamp_count = instance["timestamp_count"]
+    temporal_results = instance["temporal_results"]
+    production_expressions = instance["production_expressions"]
+    production_capacity = instance["production_capacity"]
+    storage_capacity = instance["storage_capacity"]
+    storage_flows = instance["storage_flows"]
+    temporal_export = instance["temporal_export"]
+    interconnections = instance["interconnections"]
+    incidence_matrix = instance["incidence_matrix"]
+    duration = {}
 
     """
     Step 7: Solve model
@@ -332,54 +420,63 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
     status.update("Optimizing")
     optimizing_start = datetime.now()
 
-    # Create the optimization log expander
-    with st.expander(f"{utils.format_resolution(resolution)} resolution"):
-        # Create three columns for statistics
-        col1, col2, col3 = st.columns(3)
-        stat1 = col1.empty()
-        stat2 = col2.empty()
-        stat3 = col3.empty()
-
-        log_messages = []
-        info = st.empty()
+    # Stream the optimization log and metrics to the output directory and show them at a fixed rate in the UI or console
+    (output_directory / resolution).mkdir(parents=True)
+    progress = status.create_progress(f"{utils.format_resolution(resolution)} resolution")
+    solver_progress = SolverProgress(progress, log_filepath=output_directory / resolution / "log.txt", metrics_filepath=output_directory / resolution / "metrics.jsonl")
 
     def optimization_callback(model, where):
         """
-        Show the intermediate results
+        Record the intermediate results and log messages
         """
         if where == gp.GRB.Callback.BARRIER:
             iteration = model.cbGet(gp.GRB.Callback.BARRIER_ITRCNT)
             objective_value = model.cbGet(gp.GRB.Callback.BARRIER_PRIMOBJ) / objective_scale_factor
             barrier_convergence = model.cbGet(gp.GRB.Callback.BARRIER_PRIMOBJ) / model.cbGet(gp.GRB.Callback.BARRIER_DUALOBJ) - 1
-            stat1.metric("Iteration (barrier)", f"{iteration:,}")
-            stat2.metric("Objective", f"{objective_value:,.2f}€/MWh")
-            stat3.metric("Convergence", f"{barrier_convergence:.2e}")
-        if where == gp.GRB.Callback.SIMPLEX and model.cbGet(gp.GRB.Callback.SPX_ITRCNT) % 1000 == 0:
-            iteration = model.cbGet(int(gp.GRB.Callback.SPX_ITRCNT))
+            solver_progress.add_metrics("barrier", iteration=iteration, objective=objective_value, convergence=barrier_convergence)
+        if where == gp.GRB.Callback.SIMPLEX and solver_progress.is_due("simplex"):
+            iteration = model.cbGet(gp.GRB.Callback.SPX_ITRCNT)
             objective_value = model.cbGet(gp.GRB.Callback.SPX_OBJVAL) / objective_scale_factor
             infeasibility = model.cbGet(gp.GRB.Callback.SPX_PRIMINF)
-            stat1.metric("Iteration (simplex)", f"{int(iteration):,}")
-            stat2.metric("Objective", f"{objective_value:,.2f}€/MWh")
-            stat3.metric("Infeasibility", f"{infeasibility:.2E}")
+            solver_progress.add_metrics("simplex", iteration=iteration, objective=objective_value, infeasibility=infeasibility)
         if where == gp.GRB.Callback.MESSAGE:
-            log_message = model.cbGet(gp.GRB.Callback.MSG_STRING)
-            log_messages.append(log_message)
+            solver_progress.add_log_message(model.cbGet(gp.GRB.Callback.MSG_STRING))
 
-            # Show the log message in the UI or console
-            info.code("".join(log_messages))
+    def solve():
+        """
+        Run the model and increase the numeric focus until no numerical issues are found
+        """
+        for numeric_focus in range(0, 4):
+            model.setParam("NumericFocus", numeric_focus)
+            model.optimize(optimization_callback)
+
+            # Break the loop when no numerical issues were found
+            if model.status != gp.GRB.NUMERIC:
+                break
+
+    # Run the model without the start values first if the time saved by the warm start should be measured
+    if measure_warm_start:
+        status.update("Optimizing without warm start")
+        duration["method_without_warm_start"] = _set_solver_settings(instance, config, is_warm_start=False, is_update=False)
+        solve()
+        duration["optimizing_without_warm_start"] = round((datetime.now() - optimizing_start).total_seconds())
+        model.reset()
+        _set_solver_settings(instance, config, is_warm_start=True, is_update=False)
+        solver_progress.reset_log()
+        status.update("Optimizing")
+        optimizing_start = datetime.now()
 
     # Run the model
-    for numeric_focus in range(0, 4):
-        model.setParam("NumericFocus", numeric_focus)
-        model.optimize(optimization_callback)
+    solve()
+    solver_progress.close()
+    profiler.lap("7")
 
-        # Break the loop when no numerical issues were found
-        if model.status != gp.GRB.NUMERIC:
-            break
+    # Store the size of the model, the solver settings, and the reductions of the presolver in the profile
+    profiler.add_model_statistics(model)
+    profiler.add_solver_settings(model)
+    profiler.add_presolve_statistics((output_directory / resolution / "log.txt").read_text())
 
-    # Store the LP model and optimization log
-    (output_directory / resolution).mkdir(parents=True)
-    utils.write_text(output_directory / resolution / "log.txt", "".join(log_messages))
+    # Store the LP model
     if config["optimization"]["store_model"]:
         model.write(f"{output_directory}/{resolution}/model.mps")
         model.write(f"{output_directory}/{resolution}/parameters.prm")
@@ -387,6 +484,9 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
     # Add the optimizing duration to the dictionary
     optimizing_end = datetime.now()
     duration["optimizing"] = round((optimizing_end - optimizing_start).total_seconds())
+    duration["method"] = model.getParamInfo("Method")[2]
+    if "optimizing_without_warm_start" in duration:
+        duration["warm_start_time_saved"] = duration["optimizing_without_warm_start"] - duration["optimizing"]
 
     """
     Step 8: Check if the model could be solved
@@ -417,6 +517,7 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
         error_message = "Unable to satisfy optimality tolerances"
     else:
         error_message = "The model could not be solved for an unknown reason"
+    profiler.lap("8")
 
     # Don't store the results if the optimization ended with an error
     if error_message is not None:
@@ -427,42 +528,137 @@ def optimize(config, *, resolution, previous_resolution, status, output_director
     """
     storing_start = datetime.now()
 
-    # Make a directory for each type of output
+    # Make a directory for each type of output, which is stored as CSV unless another output format is specified
+    output_format = config["optimization"].get("output_format", "csv")
     for sub_directory in ["temporal_results", "temporal_export", "production_capacities", "storage_capacities"]:
         (output_directory / resolution / sub_directory).mkdir()
 
+    # Get the optimal values of all variables with a single call
+    solution = extract_solution(model, instance["variable_groups"])
+
+    # Calculate the net export of each bidding zone with the incidence matrix
+    export_flows = solution["export"].reshape(len(interconnections), timestamp_count)
+    net_export = incidence_matrix @ export_flows
+    profiler.lap("9")
+
     # Store the actual values per bidding zone for the temporal results and capacities
     for bidding_zone in bidding_zones:
         country_flag = utils.get_country_property(utils.get_country_of_bidding_zone(bidding_zone), "flag")
         status.update(f"{country_flag} Converting and storing the results")
-        # Convert the temporal results variables and calculate the actual curtailed energy
-        temporal_results_bidding_zone = utils.convert_variables_recursively(temporal_results[bidding_zone])
-        temporal_results_bidding_zone.curtailed_MW = temporal_results_bidding_zone.apply(utils.calculate_curtailed_energy_post_hoc, config=config, axis=1)
-
-        # Store the temporal results to a CSV file
-        temporal_results_bidding_zone.to_csv(output_directory / resolution / "temporal_results" / f"{bidding_zone}.csv")
-
-        # Convert and store the production capacity
-        production_capacity_bidding_zone = utils.convert_variables_recursively(production_capacity[bidding_zone])
-        production_capacity_bidding_zone.to_csv(output_directory / resolution / "production_capacities" / f"{bidding_zone}.csv")
 
-        # Convert and store the storage capacity
-        storage_capacity_bidding_zone = utils.convert_variables_recursively(storage_capacity[bidding_zone])
-        storage_capacity_bidding_zone.to_csv(output_directory / resolution / "storage_capacities" / f"{bidding_zone}.csv")
+        # Create a dictionary with the columns of the temporal results
+        temporal_results_columns = {"demand_MW": temporal_results[bidding_zone].demand_MW.to_numpy(), "baseload_MW": temporal_results[bidding_zone].baseload_MW.to_numpy(), "curtailed_MW": None}
+
+        # Calculate the production from the capacity factor matrices and the optimal capacities
+        temporal_results_columns["production_total_MW"] = np.zeros(timestamp_count)
+        for production_technology, production_expression in production_expressions[bidding_zone].items():
+            temporal_production = production_expression["coefficients"] @ solution[bidding_zone, "production", production_technology]
+            temporal_results_columns[f"production_{production_technology}_MW"] = temporal_production
+            temporal_results_columns["production_total_MW"] += temporal_production
+
+        # Calculate the net storage flow and energy stored from the optimal inflow, outflow, and state of charge
+        temporal_results_columns["net_storage_flow_total_MW"] = np.zeros(timestamp_count)
+        temporal_results_columns["energy_stored_total_MWh"] = np.zeros(timestamp_count)
+        for storage_technology in storage_flows[bidding_zone]:
+            net_storage_flow = solution[bidding_zone, "inflow", storage_technology] - solution[bidding_zone, "outflow", storage_technology]
+            temporal_results_columns[f"net_storage_flow_{storage_technology}_MW"] = net_storage_flow
+            temporal_results_columns[f"energy_stored_{storage_technology}_MWh"] = solution[bidding_zone, "energy_stored", storage_technology]
+            temporal_results_columns["net_storage_flow_total_MW"] += net_storage_flow
+            temporal_results_columns["energy_stored_total_MWh"] += solution[bidding_zone, "energy_stored", storage_technology]
+
+        # Calculate the net export to each neighbouring bidding zone and per interconnection type from the incidence matrix
+        bidding_zone_index = bidding_zones.index(bidding_zone)
+        incidence_row = incidence_matrix.getrow(bidding_zone_index)
+        net_export_per_interconnection_type = {connection_type: np.zeros(timestamp_count) for connection_type in temporal_export}
+        for column, coefficient in zip(incidence_row.indices, incidence_row.data):
+            connection_type, (bidding_zone1, bidding_zone2) = interconnections[column]
+            other_bidding_zone = bidding_zone1 if bidding_zone2 == bidding_zone else bidding_zone2
+            column_name = f"net_export_{other_bidding_zone}_MW"
+            if column_name not in temporal_results_columns:
+                temporal_results_columns[column_name] = np.zeros(timestamp_count)
+            temporal_results_columns[column_name] += coefficient * export_flows[column]
+            net_export_per_interconnection_type[connection_type] += coefficient * export_flows[column]
+        for connection_type in net_export_per_interconnection_type:
+            temporal_results_columns[f"net_export_{connection_type}_MW"] = net_export_per_interconnection_type[connection_type]
+        temporal_results_columns["net_export_MW"] = net_export[bidding_zone_index]
+
+        # Create the temporal results DataFrame and calculate the actual curtailed energy
+        temporal_results_bidding_zone = pd.DataFrame(temporal_results_columns, index=temporal_results[bidding_zone].index)
+        temporal_results_bidding_zone.curtailed_MW = utils.calculate_curtailed_energy_post_hoc(temporal_results_bidding_zone, config=config)
+
+        # Store the temporal results
+        utils.write_output_file(temporal_results_bidding_zone, output_directory / resolution / "temporal_results", bidding_zone, output_format=output_format)
+
+        # Store the optimal production capacity per climate zone
+        production_capacity_bidding_zone = pd.DataFrame(index=production_capacity[bidding_zone].index, columns=production_capacity[bidding_zone].columns, dtype="float64")
+        for production_technology, production_expression in production_expressions[bidding_zone].items():
+            climate_zones = production_capacity[bidding_zone][production_technology].dropna().index
+            production_capacity_bidding_zone.loc[climate_zones, production_technology] = solution[bidding_zone, "production", production_technology]
+        utils.write_output_file(production_capacity_bidding_zone, output_directory / resolution / "production_capacities", bidding_zone, output_format=output_format)
+
+        # Store the optimal storage capacity
+        storage_capacity_bidding_zone = pd.DataFrame(solution[bidding_zone, "storage_capacity"].reshape(-1, 2), index=storage_capacity[bidding_zone].index, columns=["energy", "power"])
+        utils.write_output_file(storage_capacity_bidding_zone, output_directory / resolution / "storage_capacities", bidding_zone, output_format=output_format)
+        profiler.lap("9", bidding_zone=bidding_zone)
 
     # Store the actual values per connection type for the temporal export
     for connection_type in ["hvac", "hvdc"]:
-        status.update(f"Converting and storing the {connection_type.upper()} interconnection results")
-        temporal_export_connection_type = utils.convert_variables_recursively(temporal_export[connection_type])
-        temporal_export_connection_type.to_csv(output_directory / resolution / "temporal_export" / f"{connection_type}.csv")
+        status.update(f"Storing the {connection_type.upper()} interconnection results")
+        temporal_export_connection_type = pd.DataFrame({interconnection: export_flows[column] for column, (interconnection_type, interconnection) in enumerate(interconnections) if interconnection_type == connection_type}, index=temporal_results[bidding_zones[0]].index)
+        utils.write_output_file(temporal_export_connection_type, output_directory / resolution / "temporal_export", connection_type, output_format=output_format)
 
     # Upload the output to Dropbox
     if config["upload_results"]:
         status.update(f"Uploading the results to Dropbox")
         utils.upload_to_dropbox(output_directory / resolution, output_directory)
+    profiler.lap("9")
 
     # Add the storing duration to the dictionary
     storing_end = datetime.now()
     duration["storing"] = round((storing_end - storing_start).total_seconds())
 
     return {"duration": duration}
+
+
+def optimize(config, *, resolution, previous_resolution, status, output_directory, parametric_models=None, thread_count=None):
+    """
+    Create and run the model, or update and rerun the existing model of this resolution if a dictionary with parametric models is given
+    """
+    assert validate.is_config(config)
+    assert validate.is_resolution(resolution)
+    assert validate.is_resolution(previous_resolution, required=False)
+    assert validate.is_directory_path(output_directory)
+    assert validate.is_dict(parametric_models, required=False)
+    assert validate.is_integer(thread_count, min_value=1, required=False)
+
+    initializing_start = datetime.now()
+    profiler = Profiler()
+
+    # Update the parametric model of this resolution if it has been built in a previous step, otherwise build a new model
+    is_update = parametric_models is not None and resolution in parametric_models
+    if is_update:
+        instance = parametric_models[resolution]
+        _update_model(instance, config, resolution=resolution, previous_resolution=previous_resolution, status=status, output_directory=output_directory, profiler=profiler)
+    else:
+        instance = _build_model(config, resolution=resolution, previous_resolution=previous_resolution, status=status, output_directory=output_directory, parametric=parametric_models is not None, thread_count=thread_count, profiler=profiler)
+        if parametric_models is not None:
+            parametric_models[resolution] = instance
+
+    # Calculate the initializing duration
+    initializing_end = datetime.now()
+    initializing_duration = round((initializing_end - initializing_start).total_seconds())
+
+    # Set the method for a cold solve, a warm start from the previous resolution, or a re-solve of the updated model
+    is_warm_start = bool(previous_resolution) and config["time_discretization"].get("warm_start", False)
+    _set_solver_settings(instance, config, is_warm_start=is_warm_start, is_update=is_update)
+
+    # Measure the time saved by the warm start only on the last resolution of a newly built model
+    measure_warm_start = not is_update and is_warm_start and instance["is_last_resolution"] and config["time_discretization"].get("measure_warm_start", False)
+
+    # Solve the model and store the results
+    results = _solve_model(instance, config, resolution=resolution, status=status, output_directory=output_directory, measure_warm_start=measure_warm_start, profiler=profiler)
+    results["duration"] = {"initializing": initializing_duration, **results["duration"]}
+
+    # Store the duration and peak memory usage of each step and the model statistics
+    profiler.write(output_directory / resolution / "profile.yaml")
+    return results
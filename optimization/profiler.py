@@ -0,0 +1,86 @@
+import re
+import sys
+import time
+
+import utils
+import validate
+
+try:
+    import resource
+except ImportError:  # The resource module is only available on Unix
+    resource = None
+
+
+def _get_peak_memory():
+    """
+    Return the peak resident set size of the current process in MB, or None if it can't be measured on this platform
+    """
+    if resource is None:
+        return None
+
+    # The maximum resident set size is given in bytes on macOS and in kilobytes on Linux
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(max_rss / 1024 ** 2 if sys.platform == "darwin" else max_rss / 1024, 1)
+
+
+class Profiler:
+    def __init__(self):
+        self.steps = []
+        self.model_statistics = {}
+        self.presolve_statistics = {}
+        self.solver_settings = {}
+        self.last_lap = time.perf_counter()
+
+    def lap(self, step, *, bidding_zone=None):
+        """
+        Record the time since the previous lap as the duration of a step, together with the peak memory usage so far
+        """
+        assert validate.is_string(step)
+        assert validate.is_bidding_zone(bidding_zone, required=False)
+
+        now = time.perf_counter()
+        step_profile = {"step": step, "bidding_zone": bidding_zone, "duration": round(now - self.last_lap, 4), "peak_memory_MB": _get_peak_memory()}
+        self.steps.append(step_profile)
+        self.last_lap = now
+
+    def add_model_statistics(self, model):
+        """
+        Store the size and coefficient ranges of the model
+        """
+        assert validate.is_model(model)
+
+        for attribute in ["NumVars", "NumConstrs", "NumNZs", "MinCoeff", "MaxCoeff", "MinBound", "MaxBound", "MinRHS", "MaxRHS", "MinObjCoeff", "MaxObjCoeff"]:
+            self.model_statistics[attribute] = model.getAttr(attribute)
+
+    def add_solver_settings(self, model):
+        """
+        Store the method and the start and barrier parameters that were used to solve the model
+        """
+        assert validate.is_model(model)
+
+        for parameter in ["Method", "LPWarmStart", "Crossover", "BarConvTol", "NumericFocus"]:
+            self.solver_settings[parameter] = model.getParamInfo(parameter)[2]
+
+    def add_presolve_statistics(self, log):
+        """
+        Store the number of rows, columns, and nonzeros that were removed by the presolver based on the optimization log
+        """
+        assert validate.is_string(log)
+
+        removed = re.search(r"Presolve removed (\d+) rows and (\d+) columns", log)
+        if removed:
+            self.presolve_statistics["removed_rows"] = int(removed.group(1))
+            self.presolve_statistics["removed_columns"] = int(removed.group(2))
+        presolved = re.search(r"Presolved: (\d+) rows, (\d+) columns, (\d+) nonzeros", log)
+        if presolved:
+            self.presolve_statistics["rows"] = int(presolved.group(1))
+            self.presolve_statistics["columns"] = int(presolved.group(2))
+            self.presolve_statistics["nonzeros"] = int(presolved.group(3))
+
+    def write(self, filepath):
+        """
+        Store the profile as .yaml file
+        """
+        assert validate.is_filepath(filepath, suffix=".yaml")
+
+        utils.write_yaml(filepath, {"steps": self.steps, "model": self.model_statistics, "solver": self.solver_settings, "presolve": self.presolve_statistics})
@@ -0,0 +1,84 @@
+import math
+import numpy as np
+import pandas as pd
+
+import utils
+import validate
+
+
+def _read_previous_temporal_results(bidding_zone, index, *, columns, resolution, previous_resolution, output_directory):
+    """
+    Read the given columns of the temporal results of the previous resolution and resample them to the timestamps of the current resolution
+    """
+    assert validate.is_bidding_zone(bidding_zone)
+    assert validate.is_datetime_index(index)
+    assert validate.is_list_like(columns)
+    assert validate.is_resolution(resolution)
+    assert validate.is_resolution(previous_resolution)
+    assert validate.is_directory_path(output_directory)
+
+    # Get the temporal results from the previous run
+    previous_temporal_results = utils.read_output_file(output_directory / previous_resolution / "temporal_results", bidding_zone, columns=columns, parse_dates=True)
+    # Resample the previous results so it has the same timestamps as the current step
+    previous_temporal_results = previous_temporal_results.resample(resolution).mean()
+    # Find and add the rows that are missing in the previous results (the resample method does not add rows after the last timestamp)
+    for timestamp in index.difference(previous_temporal_results.index):
+        previous_temporal_results.loc[timestamp] = pd.Series([], dtype="float64")  # Sets None to all columns in the new row
+    # Remove all rows that are in previous_temporal_results but not in the new temporal_results DataFrame (don't know why this happens, but it happens sometimes)
+    previous_temporal_results = previous_temporal_results[previous_temporal_results.index.isin(index)]
+    # Interpolate the empty rows for the energy stored columns created by the resample method
+    previous_energy_stored_columns = previous_temporal_results.filter(regex="energy_stored_.+_MWh", axis=1)
+    relative_resolution = math.ceil(pd.Timedelta(previous_resolution) / pd.Timedelta(resolution))
+    previous_energy_stored_columns = previous_energy_stored_columns.interpolate().shift(relative_resolution - 1, axis=0).fillna(0)
+    previous_temporal_results[previous_energy_stored_columns.columns] = previous_energy_stored_columns
+    # Fill the empty rows created by the resample method by the value from the previous rows
+    previous_temporal_results = previous_temporal_results.ffill()
+    # Remove the leap days from the dataset that could have been introduced by the resample method
+    previous_temporal_results = previous_temporal_results[~((previous_temporal_results.index.month == 2) & (previous_temporal_results.index.day == 29))]
+    return previous_temporal_results.loc[index]
+
+
+def read_previous_solution(bidding_zones, interconnections, index, *, config, resolution, previous_resolution, output_directory):
+    """
+    Read the solution of the previous resolution as arrays with the same keys and order as the variable groups of the current model
+    """
+    assert validate.is_bidding_zone_list(bidding_zones)
+    assert validate.is_list_like(interconnections)
+    assert validate.is_datetime_index(index)
+    assert validate.is_config(config)
+    assert validate.is_resolution(resolution)
+    assert validate.is_resolution(previous_resolution)
+    assert validate.is_directory_path(output_directory)
+
+    previous_solution = {}
+
+    # Get the previous export flows in the same order as the interconnections, flows of missing interconnections are set to NaN
+    previous_temporal_export = {connection_type: utils.read_output_file(output_directory / previous_resolution / "temporal_export", connection_type, parse_dates=True, column_levels=2) for connection_type in ["hvac", "hvdc"]}
+    previous_export_flows = []
+    for connection_type, interconnection in interconnections:
+        if interconnection in previous_temporal_export[connection_type].columns:
+            previous_export_flows.append(previous_temporal_export[connection_type][interconnection].reindex(index, method="ffill").fillna(0).to_numpy())
+        else:
+            previous_export_flows.append(np.full(len(index), np.nan))
+    previous_solution["export"] = np.concatenate(previous_export_flows) if previous_export_flows else np.array([])
+
+    for bidding_zone in bidding_zones:
+        # Get the previous production capacity per climate zone
+        previous_production_capacity = utils.read_output_file(output_directory / previous_resolution / "production_capacities", bidding_zone)
+        for production_technology in config["technologies"]["production"]:
+            previous_solution[bidding_zone, "production", production_technology] = previous_production_capacity[production_technology].dropna().to_numpy()
+
+        # Get the previous storage flows and state of charge
+        storage_columns = [f"{column_type}_{storage_technology}_{unit}" for storage_technology in config["technologies"]["storage"] for column_type, unit in [("net_storage_flow", "MW"), ("energy_stored", "MWh")]]
+        previous_temporal_results = _read_previous_temporal_results(bidding_zone, index, columns=storage_columns, resolution=resolution, previous_resolution=previous_resolution, output_directory=output_directory)
+        for storage_technology in config["technologies"]["storage"]:
+            previous_net_storage_flow = previous_temporal_results[f"net_storage_flow_{storage_technology}_MW"].to_numpy()
+            previous_solution[bidding_zone, "inflow", storage_technology] = previous_net_storage_flow.clip(min=0)
+            previous_solution[bidding_zone, "outflow", storage_technology] = -previous_net_storage_flow.clip(max=0)
+            previous_solution[bidding_zone, "energy_stored", storage_technology] = previous_temporal_results[f"energy_stored_{storage_technology}_MWh"].to_numpy()
+
+        # Get the previous energy and power storage capacity
+        previous_storage_capacity = utils.read_output_file(output_directory / previous_resolution / "storage_capacities", bidding_zone)
+        previous_solution[bidding_zone, "storage_capacity"] = previous_storage_capacity.loc[list(config["technologies"]["storage"]), ["energy", "power"]].to_numpy().ravel()
+
+    return previous_solution
@@ -0,0 +1,87 @@
+import json
+import time
+
+import validate
+
+
+class SolverProgress:
+    def __init__(self, progress, *, log_filepath, metrics_filepath, update_interval=1.0):
+        assert validate.is_filepath(log_filepath, suffix=".txt")
+        assert validate.is_filepath(metrics_filepath, suffix=".jsonl")
+        assert validate.is_number(update_interval, min_value=0)
+
+        self.progress = progress
+        self.update_interval = update_interval
+        self.start_time = time.monotonic()
+
+        # Open the log and metrics files line buffered, so every line can be read while the solver is running
+        self.log_file = open(log_filepath, "w", buffering=1)
+        self.metrics_file = open(metrics_filepath, "w", buffering=1)
+
+        # Store the log messages and metrics that have not been shown yet
+        self.pending_log_messages = []
+        self.pending_metrics = None
+        self.last_metrics_update = {"barrier": 0, "simplex": 0}
+        self.last_display_update = 0
+
+    def is_due(self, algorithm):
+        """
+        Return True if the metrics of the algorithm have not been recorded within the update interval
+        """
+        return time.monotonic() - self.last_metrics_update[algorithm] >= self.update_interval
+
+    def add_metrics(self, algorithm, *, iteration, objective, **metrics):
+        """
+        Add a line to the metrics stream and show the metrics if the last update is longer ago than the update interval
+        """
+        self.last_metrics_update[algorithm] = time.monotonic()
+        elapsed_time = self.last_metrics_update[algorithm] - self.start_time
+        self.metrics_file.write(json.dumps({"time": round(elapsed_time, 3), "algorithm": algorithm, "iteration": int(iteration), "objective": objective, **metrics}) + "\n")
+
+        # Format the metrics for the progress display
+        self.pending_metrics = {f"Iteration ({algorithm})": f"{int(iteration):,}", "Objective": f"{objective:,.2f}€/MWh"}
+        for label, value in metrics.items():
+            self.pending_metrics[label.capitalize()] = f"{value:.2e}"
+        self._update_display()
+
+    def add_log_message(self, log_message):
+        """
+        Write the log message directly to the log file and show it when the last update is longer ago than the update interval
+        """
+        self.log_file.write(log_message)
+        self.pending_log_messages.append(log_message)
+        self._update_display()
+
+    def reset_log(self):
+        """
+        Remove everything that has been written to the log and metrics files and shown in the progress display
+        """
+        for file in [self.log_file, self.metrics_file]:
+            file.seek(0)
+            file.truncate()
+        self.pending_log_messages = []
+        self.pending_metrics = None
+        self.progress.clear_log()
+
+    def close(self):
+        """
+        Show the remaining log messages and metrics and close the files
+        """
+        self._update_display(force=True)
+        self.log_file.close()
+        self.metrics_file.close()
+
+    def _update_display(self, *, force=False):
+        """
+        Show the pending log messages and metrics at most once per update interval
+        """
+        if not force and time.monotonic() - self.last_display_update < self.update_interval:
+            return
+        self.last_display_update = time.monotonic()
+
+        if self.pending_metrics is not None:
+            self.progress.update_metrics(self.pending_metrics)
+            self.pending_metrics = None
+        if self.pending_log_messages:
+            self.progress.add_log_message("".join(self.pending_log_messages))
+            self.pending_log_messages = []
@@ -1,9 +1,106 @@
+from collections import deque
+from datetime import datetime
 import streamlit as st
 
 
+class Progress:
+    def update_metrics(self, metrics):
+        pass
+
+    def add_log_message(self, log_message):
+        pass
+
+    def clear_log(self):
+        pass
+
+
+class StreamlitProgress(Progress):
+    def __init__(self, title, *, log_line_count=50):
+        with st.expander(title):
+            # Create a column for each statistic
+            self.metrics = [column.empty() for column in st.columns(3)]
+
+            # Only show the last lines of the log, so each update takes the same time regardless of the length of the log
+            self.log_lines = deque(maxlen=log_line_count)
+            self.info = st.empty()
+            st.caption(f"Only the last {log_line_count} lines are shown, the full log is stored in log.txt")
+
+    def update_metrics(self, metrics):
+        for metric, (label, value) in zip(self.metrics, metrics.items()):
+            metric.metric(label, value)
+
+    def add_log_message(self, log_message):
+        self.log_lines.extend(log_message.splitlines())
+        self.info.code("\n".join(self.log_lines))
+
+    def clear_log(self):
+        self.log_lines.clear()
+        self.info.empty()
+
+
+class ConsoleProgress(Progress):
+    def __init__(self, status):
+        self.status = status
+
+    def add_log_message(self, log_message):
+        self.status.write(log_message.rstrip("\n"))
+
+
 class Status:
     def __init__(self):
         self.status = st.empty()
 
     def update(self, text, *, status_type="info"):
         getattr(self.status, status_type)(text)
+
+    def header(self, text):
+        st.subheader(text)
+
+    def create_sub_status(self):
+        return Status()
+
+    def create_progress(self, title):
+        return StreamlitProgress(title)
+
+
+class ConsoleStatus:
+    def __init__(self, *, log_filepath=None, show_solver_log=True):
+        self.log_filepath = log_filepath
+        self.show_solver_log = show_solver_log
+
+    def write(self, text):
+        print(text, flush=True)
+        if self.log_filepath is not None:
+            with open(self.log_filepath, "a") as f:
+                f.write(f"{text}\n")
+
+    def update(self, text, *, status_type="info"):
+        self.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {status_type.upper()}: {text}")
+
+    def header(self, text):
+        self.write(f"\n{text}\n{'=' * len(text)}")
+
+    def create_sub_status(self):
+        return self
+
+    def create_progress(self, title):
+        self.header(title)
+        return ConsoleProgress(self) if self.show_solver_log else Progress()
+
+
+class QueueStatus:
+    def __init__(self, queue, *, step_key):
+        self.queue = queue
+        self.step_key = step_key
+
+    def update(self, text, *, status_type="info"):
+        self.queue.put((self.step_key, text, status_type))
+
+    def header(self, text):
+        self.update(text)
+
+    def create_sub_status(self):
+        return self
+
+    def create_progress(self, title):
+        return Progress()
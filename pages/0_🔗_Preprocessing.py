@@ -1,8 +1,7 @@
-from datetime import datetime
 import openpyxl
-import pandas as pd
 import streamlit as st
 
+import preprocessing
 import utils
 import validate
 
@@ -27,86 +26,20 @@ def _download_data(url, filepath, excel_filenames):
     st.experimental_rerun()
 
 
-def _validate_and_import_bidding_zone_data():
+def _validate_and_import_data(data_type, placeholder):
     """
-    Validate and preprocess all bidding zone data
+    Validate and preprocess all bidding zone or interconnection data on a pool of worker processes
     """
-    # Get a list with all bidding zones
-    countries = utils.read_yaml(utils.path("input", "countries.yaml"))
-    bidding_zones = [bidding_zone for country in countries for bidding_zone in country["bidding_zones"]]
+    assert data_type in ["bidding_zones", "interconnections"]
 
-    # Initialize a progress bar
-    bidding_zone_progress = st.progress(0.0)
+    # Initialize a progress bar that shows the progress of all workers
+    progress_bar = st.progress(0.0)
 
-    for year_index, year in enumerate(years):
-        for bidding_zone_index, bidding_zone in enumerate(bidding_zones):
-            bidding_zone_progress.progress(year_index / len(years) + bidding_zone_index / len(years) / len(bidding_zones))
+    with st.spinner(f"Preprocessing the {utils.format_str(data_type).lower()} data"):
+        preprocessing.run_preprocessing(years, data_types=[data_type], progress_callback=progress_bar.progress)
 
-            filename = utils.path("input", "bidding_zones", year, f"{bidding_zone}.csv")
-            if filename.is_file():
-                is_valid_file = True
-                data = utils.read_csv(filename, parse_dates=True, index_col=0)
-
-                if not validate.is_dataframe(data):
-                    is_valid_file = False
-
-                if not "demand_MW" in data.columns or len(data.columns) < 2:
-                    is_valid_file = False
-
-                # Check if the DataFrame has any missing timestamps
-                start_date = pd.Timestamp(datetime.strptime("1982-01-01", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
-                end_date = pd.Timestamp(datetime.strptime("2016-12-31", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
-                required_timestamps = pd.date_range(start=start_date, end=end_date, freq="1H")
-                missing_timestamps = required_timestamps.difference(data.index)
-                has_missing_timestamps = len(missing_timestamps[~((missing_timestamps.month == 2) & (missing_timestamps.day == 29))]) != 0
-                if has_missing_timestamps:
-                    is_valid_file = False
-
-            if not is_valid_file:
-                with st.spinner(f"Preprocessing {bidding_zone} ({year})"):
-                    utils.preprocess_bidding_zone(bidding_zone, year)
-
-    bidding_zone_progress.empty()
-    bidding_zone_placeholder.success("The data for all bidding zones is succesfully preprocessed")
-
-
-def _validate_and_import_interconnection_data():
-    """
-    Validate and preprocess all interconnection data
-    """
-    interconnection_progress = st.progress(0.0)
-
-    for year_index, year in enumerate(years):
-        interconnection_types = ["hvac", "hvdc", "limits"]
-        for interconnection_type_index, interconnection_type in enumerate(interconnection_types):
-            interconnection_progress.progress(year_index / len(years) + interconnection_type_index / len(years) / len(interconnection_types))
-
-            filename = utils.path("input", "interconnections", year, f"{interconnection_type}.csv")
-            if filename.is_file():
-                is_valid_file = True
-                data = utils.read_csv(filename, parse_dates=True, index_col=0, header=[0, 1])
-
-                if not validate.is_dataframe(data):
-                    is_valid_file = False
-
-                if len(data.columns) < 2 or not all(validate.is_interconnection_tuple(column) for column in data.columns):
-                    is_valid_file = False
-
-                # Check if the DataFrame has any missing timestamps
-                start_date = pd.Timestamp(datetime.strptime(f"{year}-01-01", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
-                end_date = pd.Timestamp(datetime.strptime(f"{year}-12-31", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
-                required_timestamps = pd.date_range(start=start_date, end=end_date, freq="1H")
-                missing_timestamps = required_timestamps.difference(data.index)
-                has_missing_timestamps = len(missing_timestamps[~((missing_timestamps.month == 2) & (missing_timestamps.day == 29))]) != 0
-                if has_missing_timestamps:
-                    is_valid_file = False
-
-            if not is_valid_file:
-                with st.spinner(f"Preprocessing {utils.format_str(interconnection_type)} interconnections ({year})"):
-                    utils.preprocess_interconnections(interconnection_type, year)
-
-    interconnection_progress.empty()
-    interconnection_placeholder.success("The data for all interconnections is succesfully preprocessed")
+    progress_bar.empty()
+    placeholder.success(f"The data for all {utils.format_str(data_type).lower()} is succesfully preprocessed")
 
 
 # Global variables
@@ -139,7 +72,7 @@ if not utils.validate_files(climate_filenames):
 if utils.validate_files(demand_filenames) and utils.validate_files(climate_filenames):
     bidding_zone_placeholder = st.empty()
     if bidding_zone_placeholder.button("Validate and preprocess bidding zone data"):
-        _validate_and_import_bidding_zone_data()
+        _validate_and_import_data("bidding_zones", bidding_zone_placeholder)
 
 
 # Check and download the interconnection files
@@ -155,4 +88,4 @@ if not utils.validate_files(interconnection_filenames):
 else:
     interconnection_placeholder = st.empty()
     if interconnection_placeholder.button("Validate and preprocess interconnection data"):
-        _validate_and_import_interconnection_data()
+        _validate_and_import_data("interconnections", interconnection_placeholder)
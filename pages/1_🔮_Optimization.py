@@ -20,7 +20,7 @@ with st.sidebar.expander("Scope"):
     config["model_year"] = st.selectbox("Model year", [2025, 2030], index=1)
 
     # Select the countries
-    countries = utils.read_yaml(utils.path("input", "countries.yaml"))
+    countries = utils.country_registry.get_countries()
     country_codes = [country["nuts_2"] for country in countries]
     if st.checkbox("Include all countries", value=True):
         config["country_codes"] = country_codes
@@ -51,7 +51,7 @@ with st.sidebar.expander("Technologies"):
     col1, col2 = st.columns(2)
     col1.subheader("Production")
     config["technologies"]["production"] = {}
-    production_technology_options = utils.read_yaml(utils.path("input", "technologies", "production.yaml")).keys()
+    production_technology_options = utils.technology_registry.get_technologies("production")
     for technology in production_technology_options:
         if col1.checkbox(utils.format_technology(technology), value=True):
             config["technologies"]["production"][technology] = scenario_level
@@ -59,7 +59,7 @@ with st.sidebar.expander("Technologies"):
     # Select the storage technologies
     col2.subheader("Storage")
     config["technologies"]["storage"] = {}
-    storage_technologies_options = utils.read_yaml(utils.path("input", "technologies", "storage.yaml")).keys()
+    storage_technologies_options = utils.technology_registry.get_technologies("storage")
     for technology in storage_technologies_options:
         if col2.checkbox(utils.format_technology(technology), value=True):
             config["technologies"]["storage"][technology] = scenario_level
@@ -86,8 +86,15 @@ with st.sidebar.expander("Sensitivity analysis"):
 
     # Show the relevant input parameters for each sensitivity analysis type
     if sensitivity_analysis_type == "curtailment":
+        search_method_options = {"step_factor": "Fixed step factor", "root_finding": "Target curtailment levels"}
+        sensitivity_config["search_method"] = st.selectbox("Search method", search_method_options.keys(), format_func=lambda key: search_method_options[key])
         sensitivity_config["step_factor"] = st.number_input("Step factor", value=1.2, min_value=1.05, step=0.05)
         sensitivity_config["curtailment_range"] = list(st.slider("Curtailment range", value=(0.05, 0.95), min_value=0.01, max_value=0.99))
+        if sensitivity_config["search_method"] == "root_finding":
+            number_of_targets = st.slider("Number of target levels", value=10, min_value=2, max_value=50)
+            curtailment_targets = np.linspace(start=min(sensitivity_config["curtailment_range"]), stop=max(sensitivity_config["curtailment_range"]), num=number_of_targets)
+            sensitivity_config["curtailment_targets"] = [float(curtailment_target) for curtailment_target in curtailment_targets]
+            sensitivity_config["curtailment_tolerance"] = st.number_input("Curtailment tolerance", value=0.005, min_value=0.001, max_value=0.05, step=0.001, format="%.3f")
     elif sensitivity_analysis_type == "climate_years":
         number_of_climate_years = config["climate_years"]["end"] - config["climate_years"]["start"] + 1
         if number_of_climate_years < 3:
@@ -117,6 +124,10 @@ with st.sidebar.expander("Sensitivity analysis"):
         sensitity_steps = np.linspace(start=sensitivity_start, stop=sensitivity_stop, num=number_steps)
         sensitivity_config["steps"] = {f"{step:.3f}": float(step) for step in sensitity_steps}
 
+    # Select the number of steps that run in parallel, the curtailment analysis always runs its steps one after another
+    if sensitivity_analysis_type not in [None, "curtailment"]:
+        sensitivity_config["parallel_steps"] = st.slider("Parallel steps", value=1, min_value=1, max_value=max(os.cpu_count() // 2, 2))
+
 
 # Set the time discretization parameters
 with st.sidebar.expander("Time discretization"):
@@ -131,6 +142,17 @@ with st.sidebar.expander("Time discretization"):
     config["time_discretization"]["capacity_propagation"] = st.slider("Capacity propagation", value=1.0, disabled=not multiple_stages)
     config["time_discretization"]["soc_propagation"] = st.slider("SoC propagation", value=1.0, disabled=not multiple_stages)
 
+    # Select if the solution of the previous stage should be used as warm start
+    warm_start_help = "The warm-started stages are solved with the selected optimization method, unless another warm start method is selected"
+    config["time_discretization"]["warm_start"] = st.checkbox("Warm start from previous stage", disabled=not multiple_stages, help=warm_start_help)
+
+    # Select the method for the warm-started stages, only the primal simplex method uses the start values directly
+    warm_start_method_options = {None: "Same as optimization method", 0: "Primal simplex", 1: "Dual simplex", 2: "Barrier", 3: "Concurrent"}
+    warm_start_method = st.selectbox("Warm start method", warm_start_method_options.keys(), format_func=lambda key: warm_start_method_options[key], disabled=not config["time_discretization"]["warm_start"])
+    if warm_start_method is not None:
+        config["time_discretization"]["warm_start_method"] = warm_start_method
+    config["time_discretization"]["measure_warm_start"] = st.checkbox("Measure time saved by warm start", disabled=not config["time_discretization"]["warm_start"])
+
 
 # Set the optimization parameters
 with st.sidebar.expander("Optimization parameters"):
@@ -147,6 +169,10 @@ with st.sidebar.expander("Optimization parameters"):
     # Check if the optimization data should be stored
     config["optimization"]["store_model"] = st.checkbox("Store optimization data")
 
+    # Select the file format of the results
+    output_format_options = {"parquet": "Parquet (compressed)", "csv": "CSV"}
+    config["optimization"]["output_format"] = st.selectbox("Output format", output_format_options.keys(), format_func=lambda key: output_format_options[key])
+
 
 # Check if a notification should be send and results uploaded when the model finishes
 dropbox_keys_available = utils.getenv("DROPBOX_APP_KEY") and utils.getenv("DROPBOX_APP_SECRET") and utils.getenv("DROPBOX_REFRESH_TOKEN")
@@ -16,7 +16,7 @@ def run():
     variability_type = st.sidebar.radio("Variability", ["day", "year"], format_func=utils.format_str)
 
     # Get the country code
-    countries = utils.read_yaml(utils.path("input", "countries.yaml"))
+    countries = utils.country_registry.get_countries()
     country_codes = [country["nuts_2"] for country in countries]
     format_func = lambda nuts_2: utils.get_country_property(nuts_2, "name")
     country_code = st.sidebar.selectbox("Country", country_codes, index=country_codes.index("NL"), format_func=format_func)
@@ -0,0 +1 @@
+from .run_preprocessing import run_preprocessing
@@ -0,0 +1,41 @@
+import argparse
+
+import utils
+
+from . import run_preprocessing
+
+
+def main():
+    """
+    Validate and preprocess the bidding zone and interconnection data from the command line without the Streamlit interface
+    """
+    parser = argparse.ArgumentParser(prog="python -m preprocessing", description="Validate and preprocess the ERAA data without the Streamlit interface")
+    parser.add_argument("--years", type=int, nargs="+", default=[2025, 2030], help="model years to preprocess (default: 2025 2030)")
+    parser.add_argument("--data-types", nargs="+", choices=["bidding_zones", "interconnections"], default=["bidding_zones", "interconnections"], help="data to preprocess (default: bidding_zones interconnections)")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: the number of processors)")
+    args = parser.parse_args()
+
+    # Check if the ERAA files have been downloaded
+    filepaths = []
+    for year in args.years:
+        if "bidding_zones" in args.data_types:
+            filepaths += [utils.path("input", "eraa", "Demand Data", f"Demand_TimeSeries_{year}_NationalEstimates.xlsx")]
+            filepaths += [utils.path("input", "eraa", "Climate Data", f"PECD_{production_type}_{year}_edition 2021.3.xlsx") for production_type in ["LFSolarPV", "Onshore", "Offshore"]]
+        if "interconnections" in args.data_types:
+            filepaths += [utils.path("input", "eraa", "Transfer Capacities", f"Transfer Capacities_ERAA2021_TY{year}.xlsx")]
+    missing_filepaths = [filepath for filepath in filepaths if not filepath.is_file()]
+    if missing_filepaths:
+        parser.error(f"The ERAA files could not be found, download them on the Preprocessing page: {', '.join(str(filepath) for filepath in missing_filepaths)}")
+
+    # Preprocess the data and show the progress on a single line
+    preprocessed = run_preprocessing(args.years, data_types=args.data_types, max_workers=args.workers, progress_callback=lambda fraction: print(f"\rPreprocessing: {fraction:.0%}", end="", flush=True))
+    print()
+
+    # Show the preprocessed bidding zones and interconnection types
+    for data_type, preprocessed_per_year in preprocessed.items():
+        for year, preprocessed_items in preprocessed_per_year.items():
+            print(f"{utils.format_str(data_type)} ({year}): {', '.join(preprocessed_items) if preprocessed_items else 'all data is valid'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import hashlib
+import importlib
+import pandas as pd
+import yaml
+
+import utils
+import validate
+
+
+# The modules of which the code is used to create the preprocessed files of each data type
+CODE_MODULES = {
+    "bidding_zones": ["utils.import_eraa_workbook", "utils.merge_bidding_zone_data", "utils.store_bidding_zone_data", "utils.create_datetime_index", "utils.create_temporal_data_store", "utils.describe_temporal_data"],
+    "interconnections": ["utils.preprocess_interconnections", "utils.create_datetime_index"],
+}
+
+
+def _get_key(filepath):
+    """
+    Return the path of a file relative to the input directory as used in the manifest
+    """
+    assert validate.is_filepath(filepath)
+
+    return filepath.relative_to(utils.path("input")).as_posix()
+
+
+def read_manifest():
+    """
+    Return the manifest of the preprocessed files, or an empty manifest if it doesn't exist yet
+    """
+    # Read the file directly instead of with utils.read_yaml, since the cached content would be outdated after each update
+    filepath = utils.path("input", "manifest.yaml")
+    if not filepath.is_file():
+        return {"files": {}, "outputs": {}}
+    with open(filepath) as f:
+        return yaml.load(f, Loader=yaml.SafeLoader)
+
+
+def write_manifest(manifest):
+    """
+    Store the manifest of the preprocessed files
+    """
+    assert validate.is_dict(manifest)
+
+    utils.write_yaml(utils.path("input", "manifest.yaml"), manifest, exist_ok=True)
+
+
+def get_code_version(data_type):
+    """
+    Return a hash of the code that creates the preprocessed files of a data type, so the files are rebuilt when the code changes
+    """
+    assert data_type in CODE_MODULES
+
+    code_hash = hashlib.sha256()
+    for module_name in CODE_MODULES[data_type]:
+        with open(importlib.import_module(module_name).__file__, "rb") as f:
+            code_hash.update(f.read())
+    return code_hash.hexdigest()[:12]
+
+
+def describe_file(filepath):
+    """
+    Return the SHA-256 checksum, size, and modification time of a file
+    """
+    assert validate.is_filepath(filepath, existing=True)
+
+    checksum = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(2 ** 20), b""):
+            checksum.update(chunk)
+    stat = filepath.stat()
+    return {"checksum": checksum.hexdigest(), "size": stat.st_size, "modified": stat.st_mtime_ns}
+
+
+def get_checksum(manifest, filepath):
+    """
+    Return the checksum of a file, the checksum in the manifest is reused if the size and modification time haven't changed
+    """
+    assert validate.is_dict(manifest)
+    assert validate.is_filepath(filepath)
+
+    if not filepath.is_file():
+        return None
+
+    key = _get_key(filepath)
+    stat = filepath.stat()
+    file_description = manifest["files"].get(key)
+    if file_description is None or file_description["size"] != stat.st_size or file_description["modified"] != stat.st_mtime_ns:
+        file_description = describe_file(filepath)
+        manifest["files"][key] = file_description
+    return file_description["checksum"]
+
+
+def describe_output(filepath, data):
+    """
+    Return the file description, the row count, and the time coverage of a preprocessed file
+    """
+    assert validate.is_filepath(filepath, existing=True)
+    assert validate.is_dataframe(data)
+
+    index = pd.to_datetime(data.index, utc=True)
+    return {"file": describe_file(filepath), "row_count": len(index), "start": index.min().isoformat(), "end": index.max().isoformat()}
+
+
+def add_output(manifest, filepath, output_description, *, source_filepaths, code_version):
+    """
+    Add a preprocessed file with the checksums of its source files and the version of the code to the manifest
+    """
+    assert validate.is_dict(manifest)
+    assert validate.is_filepath(filepath)
+    assert validate.is_dict(output_description)
+    assert validate.is_filepath_list(source_filepaths)
+    assert validate.is_string(code_version)
+
+    key = _get_key(filepath)
+    manifest["files"][key] = output_description["file"]
+    manifest["outputs"][key] = {
+        "code_version": code_version,
+        "sources": {_get_key(source_filepath): get_checksum(manifest, source_filepath) for source_filepath in source_filepaths},
+        "checksum": output_description["file"]["checksum"],
+        "row_count": output_description["row_count"],
+        "start": output_description["start"],
+        "end": output_description["end"],
+    }
+
+
+def is_up_to_date(manifest, filepath, *, source_filepaths, code_version, start, end):
+    """
+    Check with the manifest if a preprocessed file is unchanged, covers the required time range, and has been created from the current source files and code
+    """
+    assert validate.is_dict(manifest)
+    assert validate.is_filepath(filepath)
+    assert validate.is_filepath_list(source_filepaths)
+    assert validate.is_string(code_version)
+    assert validate.is_datetime(start)
+    assert validate.is_datetime(end)
+
+    output = manifest["outputs"].get(_get_key(filepath))
+    if output is None or output["code_version"] != code_version:
+        return False
+
+    # Check if the source files are the same as the ones the file has been created from
+    if output["sources"] != {_get_key(source_filepath): get_checksum(manifest, source_filepath) for source_filepath in source_filepaths}:
+        return False
+
+    # Check if the file covers the required time range
+    if pd.Timestamp(output["start"]) > start or pd.Timestamp(output["end"]) < end:
+        return False
+
+    # Check if the file itself hasn't changed since it has been created
+    return get_checksum(manifest, filepath) == output["checksum"]
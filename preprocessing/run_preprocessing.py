@@ -0,0 +1,256 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+import multiprocessing
+import pandas as pd
+
+import utils
+import validate
+
+from .manifest import add_output, describe_output, get_code_version, is_up_to_date, read_manifest, write_manifest
+
+
+def _read_valid_bidding_zone_file(filepath):
+    """
+    Return the preprocessed data of a bidding zone if it exists and is complete, otherwise return None
+    """
+    assert validate.is_filepath(filepath, suffix=".csv")
+
+    if not filepath.is_file():
+        return None
+
+    data = utils.read_csv(filepath, parse_dates=True, index_col=0)
+    if not validate.is_dataframe(data):
+        return None
+
+    if not "demand_MW" in data.columns or len(data.columns) < 2:
+        return None
+
+    # Check if the DataFrame has any missing timestamps
+    start_date = pd.Timestamp(datetime.strptime("1982-01-01", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
+    end_date = pd.Timestamp(datetime.strptime("2016-12-31", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
+    required_timestamps = pd.date_range(start=start_date, end=end_date, freq="1H")
+    missing_timestamps = required_timestamps.difference(data.index)
+    has_missing_timestamps = len(missing_timestamps[~((missing_timestamps.month == 2) & (missing_timestamps.day == 29))]) != 0
+    if has_missing_timestamps:
+        return None
+
+    # Create the store with a file per climate year for data that has been preprocessed before the store existed
+    if not (filepath.with_suffix("") / "manifest.yaml").is_file():
+        utils.create_temporal_data_store(data, filepath.with_suffix(""))
+
+    return data
+
+
+def _read_valid_interconnection_file(filepath, year):
+    """
+    Return the preprocessed data of an interconnection type if it exists and is complete, otherwise return None
+    """
+    assert validate.is_filepath(filepath, suffix=".csv")
+    assert validate.is_model_year(year)
+
+    if not filepath.is_file():
+        return None
+
+    data = utils.read_csv(filepath, parse_dates=True, index_col=0, header=[0, 1])
+    if not validate.is_dataframe(data):
+        return None
+
+    if len(data.columns) < 2 or not all(validate.is_interconnection_tuple(column) for column in data.columns):
+        return None
+
+    # Check if the DataFrame has any missing timestamps
+    start_date = pd.Timestamp(datetime.strptime(f"{year}-01-01", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
+    end_date = pd.Timestamp(datetime.strptime(f"{year}-12-31", "%Y-%m-%d").strftime("%Y-%m-%d 00:00:00+00:00"))
+    required_timestamps = pd.date_range(start=start_date, end=end_date, freq="1H")
+    missing_timestamps = required_timestamps.difference(data.index)
+    has_missing_timestamps = len(missing_timestamps[~((missing_timestamps.month == 2) & (missing_timestamps.day == 29))]) != 0
+    if has_missing_timestamps:
+        return None
+
+    return data
+
+
+def _get_source_filepaths(data_type, year):
+    """
+    Return the files from which the preprocessed files of a data type and year are created
+    """
+    assert data_type in ["bidding_zones", "interconnections"]
+    assert validate.is_model_year(year)
+
+    if data_type == "bidding_zones":
+        return [filepath for filepath, column_name in utils.get_eraa_workbooks(year)] + [utils.path("input", "countries.yaml")]
+    return [utils.path("input", "eraa", "Transfer Capacities", f"Transfer Capacities_ERAA2021_TY{year}.xlsx")]
+
+
+def _get_required_time_range(data_type, year):
+    """
+    Return the first and last timestamp that should be included in the preprocessed files of a data type and year
+    """
+    assert data_type in ["bidding_zones", "interconnections"]
+    assert validate.is_model_year(year)
+
+    if data_type == "bidding_zones":
+        return pd.Timestamp("1982-01-01", tz="UTC"), pd.Timestamp("2016-12-31", tz="UTC")
+    return pd.Timestamp(f"{year}-01-01", tz="UTC"), pd.Timestamp(f"{year}-12-31", tz="UTC")
+
+
+def _validate_output(manifest, filepath, *, data_type, year):
+    """
+    Check with the manifest if a preprocessed file is up to date, files that have been preprocessed before the manifest existed are fully validated and added to the manifest
+    """
+    assert validate.is_dict(manifest)
+    assert validate.is_filepath(filepath, suffix=".csv")
+    assert data_type in ["bidding_zones", "interconnections"]
+    assert validate.is_model_year(year)
+
+    source_filepaths = _get_source_filepaths(data_type, year)
+    code_version = get_code_version(data_type)
+    start, end = _get_required_time_range(data_type, year)
+    if is_up_to_date(manifest, filepath, source_filepaths=source_filepaths, code_version=code_version, start=start, end=end):
+        # Create the store with a file per climate year if it has been removed
+        if data_type == "bidding_zones" and not (filepath.with_suffix("") / "manifest.yaml").is_file():
+            utils.create_temporal_data_store(utils.read_csv(filepath, parse_dates=True, index_col=0), filepath.with_suffix(""))
+        return True
+
+    # Files that are in the manifest but are not up to date are preprocessed again
+    if filepath.relative_to(utils.path("input")).as_posix() in manifest["outputs"]:
+        return False
+
+    # Validate the complete file if it has been preprocessed before the manifest existed and describe the data that has been read for the validation
+    if data_type == "bidding_zones":
+        data = _read_valid_bidding_zone_file(filepath)
+    else:
+        data = _read_valid_interconnection_file(filepath, year)
+    if data is None:
+        return False
+    add_output(manifest, filepath, describe_output(filepath, data), source_filepaths=source_filepaths, code_version=code_version)
+    return True
+
+
+def _store_bidding_zone(data, *, bidding_zone, year):
+    """
+    Store the data of a bidding zone in a worker process and return the description of the stored file for the manifest
+    """
+    assert validate.is_dataframe(data)
+    assert validate.is_bidding_zone(bidding_zone)
+    assert validate.is_model_year(year)
+
+    utils.store_bidding_zone_data(data, bidding_zone=bidding_zone, year=year)
+    return describe_output(utils.path("input", "bidding_zones", year, f"{bidding_zone}.csv"), data)
+
+
+def _preprocess_interconnection_type(interconnection_type, year):
+    """
+    Preprocess an interconnection type in a worker process and return the description of the stored file for the manifest
+    """
+    assert validate.is_interconnection_type(interconnection_type)
+    assert validate.is_model_year(year)
+
+    utils.preprocess_interconnections(interconnection_type, year)
+    filepath = utils.path("input", "interconnections", year, f"{interconnection_type}.csv")
+    return describe_output(filepath, pd.read_csv(filepath, parse_dates=True, index_col=0, header=[0, 1]))
+
+
+def run_preprocessing(years, *, data_types=("bidding_zones", "interconnections"), max_workers=None, progress_callback=None):
+    """
+    Validate the preprocessed data with the manifest and preprocess the outdated bidding zones and interconnection types on a pool of worker processes
+    """
+    assert validate.is_list_like(years)
+    assert all(validate.is_model_year(year) for year in years)
+    assert validate.is_list_like(data_types)
+    assert all(data_type in ["bidding_zones", "interconnections"] for data_type in data_types)
+    assert validate.is_integer(max_workers, min_value=1, required=False)
+
+    # Get a list with all bidding zones
+    bidding_zones = utils.country_registry.get_bidding_zones()
+    interconnection_types = ["hvac", "hvdc", "limits"]
+
+    # Count the validations and the tasks as if all files are invalid, the skipped tasks are removed from the total so the progress never decreases
+    bidding_zone_task_count = (2 * len(bidding_zones) + len(utils.get_eraa_workbooks(years[0]))) if "bidding_zones" in data_types else 0
+    interconnection_task_count = 2 * len(interconnection_types) if "interconnections" in data_types else 0
+    progress = {"completed": 0, "total": len(years) * (bidding_zone_task_count + interconnection_task_count)}
+
+    def update_progress(*, completed=1, skipped=0):
+        """
+        Add the completed validations or tasks and remove the skipped tasks and report the fraction that has been completed
+        """
+        progress["completed"] += completed
+        progress["total"] -= skipped
+        if progress_callback is not None:
+            progress_callback(progress["completed"] / max(progress["total"], 1))
+
+    # Find the invalid files
+    manifest = read_manifest()
+    invalid_bidding_zones = {}
+    invalid_interconnection_types = {}
+    for year in years:
+        if "bidding_zones" in data_types:
+            invalid_bidding_zones[year] = []
+            for bidding_zone in bidding_zones:
+                is_valid_file = _validate_output(manifest, utils.path("input", "bidding_zones", year, f"{bidding_zone}.csv"), data_type="bidding_zones", year=year)
+                if not is_valid_file:
+                    invalid_bidding_zones[year].append(bidding_zone)
+                update_progress(skipped=int(is_valid_file))
+            if not invalid_bidding_zones[year]:
+                update_progress(completed=0, skipped=len(utils.get_eraa_workbooks(year)))
+        if "interconnections" in data_types:
+            invalid_interconnection_types[year] = []
+            for interconnection_type in interconnection_types:
+                is_valid_file = _validate_output(manifest, utils.path("input", "interconnections", year, f"{interconnection_type}.csv"), data_type="interconnections", year=year)
+                if not is_valid_file:
+                    invalid_interconnection_types[year].append(interconnection_type)
+                update_progress(skipped=int(is_valid_file))
+
+    # Spawn the workers, since the Preprocessing page calls the runner from a multi-threaded process that can't safely be forked, the workers get the filepaths and DataFrames they need as task arguments
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = {}
+
+            # Import each workbook of the years with invalid bidding zones in a separate task
+            for year, invalid_bidding_zones_year in invalid_bidding_zones.items():
+                if invalid_bidding_zones_year:
+                    for workbook_index, (filepath, column_name) in enumerate(utils.get_eraa_workbooks(year)):
+                        futures[executor.submit(utils.import_eraa_workbook, filepath, bidding_zones=invalid_bidding_zones_year, column_name=column_name)] = ("workbook", year, workbook_index)
+
+            # Preprocess each invalid interconnection type in a separate task
+            for year, invalid_interconnection_types_year in invalid_interconnection_types.items():
+                for interconnection_type in invalid_interconnection_types_year:
+                    futures[executor.submit(_preprocess_interconnection_type, interconnection_type, year)] = ("interconnections", year, interconnection_type)
+
+            # Merge the workbooks of a year once all of them are imported and store each bidding zone in a separate task
+            imported_workbooks = {year: {} for year in invalid_bidding_zones}
+            pending_futures = set(futures)
+            while pending_futures:
+                done_futures, pending_futures = wait(pending_futures, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    task_type, year, key = futures[future]
+                    result = future.result()
+                    update_progress()
+
+                    # Merge the workbooks in the same order as the sequential preprocessing, so the columns are in the same order
+                    if task_type == "workbook":
+                        imported_workbooks[year][key] = result
+                        if len(imported_workbooks[year]) == len(utils.get_eraa_workbooks(year)):
+                            data = {}
+                            for workbook_index in sorted(imported_workbooks[year]):
+                                data = utils.merge_bidding_zone_data(data, imported_workbooks[year][workbook_index])
+                            del imported_workbooks[year]
+                            for bidding_zone in invalid_bidding_zones[year]:
+                                store_future = executor.submit(_store_bidding_zone, data[bidding_zone], bidding_zone=bidding_zone, year=year)
+                                futures[store_future] = ("store", year, bidding_zone)
+                                pending_futures.add(store_future)
+
+                    # Add the stored files to the manifest
+                    if task_type == "store":
+                        filepath = utils.path("input", "bidding_zones", year, f"{key}.csv")
+                        add_output(manifest, filepath, result, source_filepaths=_get_source_filepaths("bidding_zones", year), code_version=get_code_version("bidding_zones"))
+                    if task_type == "interconnections":
+                        filepath = utils.path("input", "interconnections", year, f"{key}.csv")
+                        add_output(manifest, filepath, result, source_filepaths=_get_source_filepaths("interconnections", year), code_version=get_code_version("interconnections"))
+    finally:
+        # Store the manifest, also when one of the tasks has failed so the completed files don't have to be preprocessed again
+        write_manifest(manifest)
+
+    # Return the bidding zones and interconnection types that have been preprocessed
+    return {"bidding_zones": invalid_bidding_zones, "interconnections": invalid_interconnection_types}
@@ -1,10 +1,14 @@
+from .calculate_annual_demand import calculate_annual_demand
 from .calculate_curtailed_energy_post_hoc import calculate_curtailed_energy_post_hoc
 from .calculate_distance import calculate_distance
 from .calculate_lcoe import calculate_lcoe
 from .calculate_r_squared import calculate_r_squared
 from .calculate_regression_line import calculate_regression_line
-from .convert_variables_recursively import convert_variables_recursively
+from .convert_annualized_costs_to_lcoe import convert_annualized_costs_to_lcoe
+from .country_registry import country_registry
 from .create_datetime_index import create_datetime_index
+from .create_temporal_data_store import create_temporal_data_store
+from .describe_temporal_data import describe_temporal_data
 from .download_file import download_file
 from .entsoe import entsoe
 from .find_common_columns import find_common_columns
@@ -13,8 +17,10 @@ from .format_resolution import format_resolution
 from .format_str import format_str
 from .format_technology import format_technology
 from .get_bidding_zones_for_countries import get_bidding_zones_for_countries
+from .get_climate_zone_index import get_climate_zone_index
 from .get_country_of_bidding_zone import get_country_of_bidding_zone
 from .get_country_property import get_country_property
+from .get_eraa_workbooks import get_eraa_workbooks
 from .get_export_limits import get_export_limits
 from .get_geometries_of_countries import get_geometries_of_countries
 from .get_nested_key import get_nested_key
@@ -26,18 +32,23 @@ from .get_sorted_resolution_stages import get_sorted_resolution_stages
 from .get_storage_capacity import get_storage_capacity
 from .get_temporal_results import get_temporal_results
 from .getenv import getenv
+from .import_eraa_workbook import import_eraa_workbook
+from .merge_bidding_zone_data import merge_bidding_zone_data
 from .merge_dataframes_on_column import merge_dataframes_on_column
 from .path import path
-from .preprocess_bidding_zone import preprocess_bidding_zone
 from .preprocess_interconnections import preprocess_interconnections
 from .read_csv import read_csv
+from .read_output_file import read_output_file
 from .read_shapefile import read_shapefile
 from .read_temporal_data import read_temporal_data
 from .read_text import read_text
 from .read_yaml import read_yaml
 from .send_notification import send_notification
 from .set_nested_key import set_nested_key
+from .store_bidding_zone_data import store_bidding_zone_data
+from .technology_registry import technology_registry
 from .upload_to_dropbox import upload_to_dropbox
 from .validate_files import validate_files
+from .write_output_file import write_output_file
 from .write_text import write_text
 from .write_yaml import write_yaml
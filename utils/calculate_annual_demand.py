@@ -0,0 +1,23 @@
+import pandas as pd
+
+import validate
+
+
+def calculate_annual_demand(demand_per_bidding_zone):
+    """
+    Calculate the total annual electricity demand of all bidding zones
+    """
+    assert validate.is_dataframe(demand_per_bidding_zone, column_validator=validate.is_bidding_zone)
+
+    annual_electricity_demand = 0
+    for bidding_zone in demand_per_bidding_zone.columns:
+        demand_MW = demand_per_bidding_zone[bidding_zone]
+
+        # Scale the demand of the modelled timestamps to a full year
+        demand_start_date = demand_MW.index.min()
+        demand_end_date = demand_MW.index.max()
+        share_of_year_modelled = (demand_end_date - demand_start_date) / pd.Timedelta(365, "days")
+        timestep_hours = (demand_MW.index[1] - demand_MW.index[0]).total_seconds() / 3600
+        annual_electricity_demand += demand_MW.sum() * timestep_hours / share_of_year_modelled
+
+    return annual_electricity_demand
@@ -1,38 +1,34 @@
+import numpy as np
+import pandas as pd
+
 import utils
 import validate
 
 
-def calculate_curtailed_energy_post_hoc(row, *, config):
+def calculate_curtailed_energy_post_hoc(temporal_results, *, config):
     """
-    Calculate the actual curtailed energy for a given timestamp
+    Calculate the actual curtailed energy for all timestamps of a bidding zone at once
     """
-    assert validate.is_series(row)
+    assert validate.is_dataframe(temporal_results)
     assert validate.is_config(config)
 
     # Calculate the total energy losses
-    total_losses = row.baseload_MW + row.production_total_MW - row.demand_MW
+    total_losses = temporal_results.baseload_MW.to_numpy() + temporal_results.production_total_MW.to_numpy() - temporal_results.demand_MW.to_numpy()
 
-    # Calculate the actual interconnection losses
-    interconnection_losses = 0
+    # Calculate the actual interconnection losses, which only occur when the bidding zone is a net importer
+    interconnection_losses = np.zeros(len(temporal_results.index))
     for interconnection_type in config["interconnections"]["efficiency"]:
-        if f"net_export_{interconnection_type}_MW" in row:
+        if f"net_export_{interconnection_type}_MW" in temporal_results:
             efficiency = config["interconnections"]["efficiency"][interconnection_type]
-            net_export = row[f"net_export_{interconnection_type}_MW"]
-            if net_export < 0:
-                interconnection_losses += (1 / efficiency - 1) * abs(net_export)
-
-    # Read the storage assumptions
-    storage_assumptions = utils.read_yaml(utils.path("input", "technologies", "storage.yaml"))
+            net_export = temporal_results[f"net_export_{interconnection_type}_MW"].to_numpy()
+            interconnection_losses += np.where(net_export < 0, (1 / efficiency - 1) * np.abs(net_export), 0)
 
-    # Calculate the actual storage losses
-    storage_losses = 0
-    for storage_technology in config["technologies"]["storage"]:
-        efficiency = storage_assumptions[storage_technology]["roundtrip_efficiency"] ** 0.5
-        net_storage_flow = row[f"net_storage_flow_{storage_technology}_MW"]
-        if net_storage_flow > 0:
-            storage_losses += (1 - efficiency) * net_storage_flow
-        else:
-            storage_losses += (1 / efficiency - 1) * abs(net_storage_flow)
+    # Calculate the actual storage losses, which depend on whether the storage is charging or discharging
+    storage_losses = np.zeros(len(temporal_results.index))
+    storage_efficiencies = utils.technology_registry.get_parameter("storage", "efficiency", list(config["technologies"]["storage"]))
+    for storage_technology, efficiency in zip(config["technologies"]["storage"], storage_efficiencies.tolist()):
+        net_storage_flow = temporal_results[f"net_storage_flow_{storage_technology}_MW"].to_numpy()
+        storage_losses += np.where(net_storage_flow > 0, (1 - efficiency) * net_storage_flow, (1 / efficiency - 1) * np.abs(net_storage_flow))
 
     # Calculate the curtailed energy
-    return total_losses - interconnection_losses - storage_losses
+    return pd.Series(total_losses - interconnection_losses - storage_losses, index=temporal_results.index)
@@ -5,37 +5,6 @@ import utils
 import validate
 
 
-def _calculate_crf(assumptions):
-    """
-    Calculate the Capital Recovery Factor for a specic set of technology assumptions
-    """
-    assert validate.is_dict(assumptions)
-
-    wacc = assumptions["wacc"]
-    economic_lifetime = assumptions["economic_lifetime"]
-    return wacc / (1 - (1 + wacc) ** (-economic_lifetime))
-
-
-def _calculate_scenario_costs(assumptions, variable, scenario_level):
-    """
-    Calculate the costs for a given scenario level
-    """
-    assert validate.is_dict(assumptions)
-    assert validate.is_string(variable)
-    assert validate.is_number(scenario_level, min_value=-1, max_value=1)
-
-    if scenario_level == -1:
-        return assumptions["conservative"][variable]
-    elif scenario_level == 0:
-        return assumptions["moderate"][variable]
-    elif scenario_level == 1:
-        return assumptions["advanced"][variable]
-    elif scenario_level > 0:
-        return (1 - scenario_level) * assumptions["moderate"][variable] + scenario_level * assumptions["advanced"][variable]
-    elif scenario_level < 0:
-        return (1 + scenario_level) * assumptions["moderate"][variable] - scenario_level * assumptions["conservative"][variable]
-
-
 def _calculate_annualized_production_costs(production_technologies, production_capacity_MW):
     """
     Calculate the annualized production costs
@@ -43,17 +12,18 @@ def _calculate_annualized_production_costs(production_technologies, production_c
     assert validate.is_dict(production_technologies)
     assert validate.is_dataframe(production_capacity_MW, column_validator=validate.is_technology)
 
-    # Read the production assumptions
-    production_assumptions = utils.read_yaml(utils.path("input", "technologies", "production.yaml"))
+    # Get the CRF and the scenario costs per kW of each technology
+    crf = utils.technology_registry.get_parameter("production", "crf", list(production_technologies))
+    capex_per_kW = utils.technology_registry.get_scenario_costs("production", "capex", production_technologies)
+    fixed_om_per_kW = utils.technology_registry.get_scenario_costs("production", "fixed_om", production_technologies)
 
     # Calculate the total annual production costs
     annualized_costs_production = pd.Series([], dtype="float64")
-    for technology, scenario_level in production_technologies.items():
+    for technology, technology_crf, technology_capex_per_kW, technology_fixed_om_per_kW in zip(production_technologies, crf.tolist(), capex_per_kW.tolist(), fixed_om_per_kW.tolist()):
         capacity_kW = production_capacity_MW[technology].sum() * 1000
-        capex = capacity_kW * _calculate_scenario_costs(production_assumptions[technology], "capex", scenario_level)
-        fixed_om = capacity_kW * _calculate_scenario_costs(production_assumptions[technology], "fixed_om", scenario_level)
-        crf = _calculate_crf(production_assumptions[technology])
-        annualized_costs_production[technology] = crf * capex + fixed_om
+        capex = capacity_kW * technology_capex_per_kW
+        fixed_om = capacity_kW * technology_fixed_om_per_kW
+        annualized_costs_production[technology] = technology_crf * capex + fixed_om
 
     return annualized_costs_production
 
@@ -65,38 +35,27 @@ def _calculate_annualized_storage_costs(storage_technologies, storage_capacity_M
     assert validate.is_dict(storage_technologies)
     assert validate.is_dataframe(storage_capacity_MWh)
 
-    # Read the storage assumptions
-    storage_assumptions = utils.read_yaml(utils.path("input", "technologies", "storage.yaml"))
+    # Get the CRF, the relative fixed O&M costs, and the scenario costs per kWh and kW of each technology
+    crf = utils.technology_registry.get_parameter("storage", "crf", list(storage_technologies))
+    fixed_om_share = utils.technology_registry.get_parameter("storage", "fixed_om", list(storage_technologies))
+    energy_capex_per_kWh = utils.technology_registry.get_scenario_costs("storage", "energy_capex", storage_technologies)
+    power_capex_per_kW = utils.technology_registry.get_scenario_costs("storage", "power_capex", storage_technologies)
 
     # Calculate the total annual storage costs
     annualized_costs_storage = pd.Series([], dtype="float64")
-    for technology, scenario_level in storage_technologies.items():
+    for technology, technology_crf, technology_fixed_om_share, technology_energy_capex_per_kWh, technology_power_capex_per_kW in zip(storage_technologies, crf.tolist(), fixed_om_share.tolist(), energy_capex_per_kWh.tolist(), power_capex_per_kW.tolist()):
         capacity_energy_kWh = storage_capacity_MWh.loc[technology, "energy"] * 1000
         capacity_power_kW = storage_capacity_MWh.loc[technology, "power"] * 1000
 
-        capex_energy = capacity_energy_kWh * _calculate_scenario_costs(storage_assumptions[technology], "energy_capex", scenario_level)
-        capex_power = capacity_power_kW * _calculate_scenario_costs(storage_assumptions[technology], "power_capex", scenario_level)
+        capex_energy = capacity_energy_kWh * technology_energy_capex_per_kWh
+        capex_power = capacity_power_kW * technology_power_capex_per_kW
         capex = capex_energy + capex_power
-        fixed_om = capex * storage_assumptions[technology]["fixed_om"]
-        crf = _calculate_crf(storage_assumptions[technology])
-        annualized_costs_storage[technology] = crf * capex + fixed_om
+        fixed_om = capex * technology_fixed_om_share
+        annualized_costs_storage[technology] = technology_crf * capex + fixed_om
 
     return annualized_costs_storage
 
 
-def _calculate_annual_demand(demand_MW):
-    """
-    Calculate the annual electricity demand
-    """
-    assert validate.is_series(demand_MW)
-
-    demand_start_date = demand_MW.index.min()
-    demand_end_date = demand_MW.index.max()
-    share_of_year_modelled = (demand_end_date - demand_start_date) / pd.Timedelta(365, "days")
-    timestep_hours = (demand_MW.index[1] - demand_MW.index[0]).total_seconds() / 3600
-    return demand_MW.sum() * timestep_hours / share_of_year_modelled
-
-
 def calculate_lcoe(production_capacities, storage_capacities, demand_per_bidding_zone, *, config, breakdown_level=0):
     """
     Calculate the average LCOE for all bidding zones
@@ -109,7 +68,6 @@ def calculate_lcoe(production_capacities, storage_capacities, demand_per_bidding
 
     annualized_production_costs = 0
     annualized_storage_costs = 0
-    annual_electricity_demand = 0
 
     for bidding_zone in demand_per_bidding_zone.columns:
         # Add the annualized production costs
@@ -119,9 +77,6 @@ def calculate_lcoe(production_capacities, storage_capacities, demand_per_bidding
         if storage_capacities is not None:
             annualized_storage_costs += _calculate_annualized_storage_costs(config["technologies"]["storage"], storage_capacities[bidding_zone])
 
-        # Add the annual electricity demand
-        annual_electricity_demand += _calculate_annual_demand(demand_per_bidding_zone[bidding_zone])
-
     # Calculate and return the LCOE
     if breakdown_level == 0:
         total_costs = annualized_production_costs.sum() + annualized_storage_costs.sum()
@@ -129,5 +84,4 @@ def calculate_lcoe(production_capacities, storage_capacities, demand_per_bidding
         total_costs = pd.Series({"production": annualized_production_costs.sum(), "storage": annualized_storage_costs.sum()})
     if breakdown_level == 2:
         total_costs = pd.concat([annualized_production_costs, annualized_storage_costs])
-    eur_usd = 1.1290  # Source: https://www.federalreserve.gov/releases/h10/20220110/
-    return (total_costs / annual_electricity_demand) / eur_usd
+    return utils.convert_annualized_costs_to_lcoe(total_costs, utils.calculate_annual_demand(demand_per_bidding_zone))
@@ -0,0 +1,15 @@
+import validate
+
+
+# The EUR/USD exchange rate (Source: https://www.federalreserve.gov/releases/h10/20220110/)
+EUR_USD = 1.1290
+
+
+def convert_annualized_costs_to_lcoe(annualized_costs, annual_electricity_demand):
+    """
+    Convert the annualized costs, either a number, Series, array, or linear expression, to the LCOE for the annual electricity demand
+    """
+    assert annualized_costs is not None
+    assert validate.is_number(annual_electricity_demand, min_value=0)
+
+    return (annualized_costs / annual_electricity_demand) / EUR_USD
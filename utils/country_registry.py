@@ -0,0 +1,66 @@
+import os
+import yaml
+
+from .path import path
+
+
+class CountryRegistry:
+    """
+    An index of the countries and bidding zones in countries.yaml that is read only once per working directory
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.working_directory = None
+
+    def _load(self):
+        """
+        Read the countries and create the indices if the file hasn't been read yet from the current working directory
+        """
+        working_directory = os.getcwd()
+        if working_directory == self.working_directory:
+            return
+
+        # Read the file without the Streamlit cache, so the registry also works without Streamlit
+        with open(self.filepath) as f:
+            countries = yaml.load(f, Loader=yaml.SafeLoader)
+
+        # Create the indices by country code and the maps between countries and bidding zones
+        self.countries = countries
+        self.countries_by_code = {code_type: {country[code_type]: country for country in countries} for code_type in ["nuts_2", "alpha_3"]}
+        self.bidding_zones_by_country = {country["nuts_2"]: country["bidding_zones"] for country in countries}
+        self.country_by_bidding_zone = {bidding_zone: country["nuts_2"] for country in countries for bidding_zone in country["bidding_zones"]}
+        self.working_directory = working_directory
+
+    def get_countries(self):
+        """
+        Return a list with all countries
+        """
+        self._load()
+        return self.countries
+
+    def get_country(self, country_code, *, code_type="nuts_2"):
+        """
+        Return a country via its code
+        """
+        self._load()
+        return self.countries_by_code[code_type][country_code]
+
+    def get_bidding_zones(self, country_code=None):
+        """
+        Return the bidding zones of a country, or of all countries if no country code is given
+        """
+        self._load()
+        if country_code is None:
+            return list(self.country_by_bidding_zone)
+        return self.bidding_zones_by_country[country_code]
+
+    def get_country_of_bidding_zone(self, bidding_zone):
+        """
+        Return the nuts_2 code of the country a bidding zone belongs to
+        """
+        self._load()
+        return self.country_by_bidding_zone[bidding_zone]
+
+
+country_registry = CountryRegistry(path("input", "countries.yaml"))
@@ -1,10 +1,21 @@
+import numpy as np
+import pandas as pd
+
+
 def create_datetime_index(index, year):
     """
-    Change a multiIndex (01.01, 23) into an ISO datetime string
+    Change a MultiIndex (01.01., 23) into a UTC DatetimeIndex
     """
-    new_index = []
-    for [date, hour] in index:
-        day, month, *rest = date.split(".")
-        hour = str(hour - 1).rjust(2, "0")
-        new_index.append(f"{year}-{month}-{day}T{hour}:00:00Z")
-    return new_index
+    if not isinstance(index, pd.MultiIndex):
+        index = pd.MultiIndex.from_tuples(index)
+    index = index.remove_unused_levels()
+
+    # Convert each unique date only once to the number of days since the epoch
+    day_month = pd.Series(index.levels[0]).str.split(".", expand=True).iloc[:, :2].astype(int).to_numpy()
+    months = np.datetime64(f"{year:04}-01", "M") + (day_month[:, 1] - 1)
+    dates = months.astype("datetime64[D]") + (day_month[:, 0] - 1)
+    assert (dates.astype("datetime64[M]") == months).all(), f"The index contains dates that don't exist in {year}"
+
+    # Map the dates to all rows with the level codes and add the hours
+    hours = index.get_level_values(1).astype(int).to_numpy() - 1
+    return pd.DatetimeIndex(dates[index.codes[0]] + hours.astype("timedelta64[h]"), tz="UTC")
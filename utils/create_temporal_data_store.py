@@ -0,0 +1,25 @@
+import pandas as pd
+
+import utils
+import validate
+
+
+def create_temporal_data_store(data, directory):
+    """
+    Store the temporal data of a bidding zone as a .parquet file per climate year together with a manifest of the columns, climate years, and climate zones
+    """
+    assert validate.is_dataframe(data)
+    assert validate.is_directory_path(directory)
+
+    # Make sure the index contains timestamps, the index of the preprocessed data consists of ISO datetime strings
+    data = data.set_axis(pd.to_datetime(data.index, utc=True), axis=0)
+
+    # Store the data of each climate year in a separate file, so only the required climate years have to be read
+    directory.mkdir(parents=True, exist_ok=True)
+    climate_years = sorted(data.index.year.unique())
+    for climate_year in climate_years:
+        data[data.index.year == climate_year].to_parquet(directory / f"{climate_year}.parquet")
+
+    # Store the manifest last, so an interrupted store is never used
+    manifest = {"columns": data.columns.tolist(), "climate_years": [int(climate_year) for climate_year in climate_years], **utils.describe_temporal_data(data)}
+    utils.write_yaml(directory / "manifest.yaml", manifest, exist_ok=True)
@@ -0,0 +1,22 @@
+import re
+
+import validate
+
+
+def describe_temporal_data(data):
+    """
+    Return the time coverage and the climate zones per production technology with their column position and NaN and nonzero status
+    """
+    assert validate.is_dataframe(data)
+
+    # Find the capacity factor columns in the same order as the columns, so the climate zones are always in the same order
+    climate_zones = {}
+    for position, column in enumerate(data.columns):
+        match = re.fullmatch("([^_]+)_(.+)_cf", column)
+        if match:
+            production_technology, climate_zone = match.groups()
+            has_nan = bool(data[column].isna().any())
+            is_nonzero = bool((data[column] != 0).any())
+            climate_zones.setdefault(production_technology, []).append({"climate_zone": climate_zone, "column": column, "position": position, "has_nan": has_nan, "is_nonzero": is_nonzero})
+
+    return {"start": data.index.min().isoformat(), "end": data.index.max().isoformat(), "climate_zones": climate_zones}
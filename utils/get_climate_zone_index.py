@@ -0,0 +1,27 @@
+import streamlit as st
+
+import utils
+import validate
+
+
+@st.experimental_memo(show_spinner=False)
+def get_climate_zone_index(model_year, bidding_zones):
+    """
+    Return the time coverage and the climate zones per production technology of each bidding zone
+    """
+    assert validate.is_model_year(model_year)
+    assert validate.is_bidding_zone_list(bidding_zones)
+
+    climate_zone_index = {}
+    for bidding_zone in bidding_zones:
+        filepath = utils.path("input", "bidding_zones", model_year, f"{bidding_zone}.csv")
+        manifest_filepath = filepath.with_suffix("") / "manifest.yaml"
+
+        # Use the metadata from the manifest of the temporal data store, the data is only read if it has been preprocessed before the metadata was stored
+        manifest = utils.read_yaml(manifest_filepath) if manifest_filepath.is_file() else {}
+        if "climate_zones" in manifest:
+            climate_zone_index[bidding_zone] = {key: manifest[key] for key in ["start", "end", "climate_zones"]}
+        elif filepath.is_file():
+            climate_zone_index[bidding_zone] = utils.describe_temporal_data(utils.read_temporal_data(filepath))
+
+    return climate_zone_index
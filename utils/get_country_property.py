@@ -10,11 +10,8 @@ def get_country_property(country_code, key, *, code_type="nuts_2"):
     assert validate.is_country_code(country_code, code_type=code_type)
     assert validate.is_string(key)
 
-    # Read the countries
-    countries = utils.read_yaml(utils.path("input", "countries.yaml"))
-
     # Get the specific country
-    country = next(country for country in countries if country[code_type] == country_code)
+    country = utils.country_registry.get_country(country_code, code_type=code_type)
 
     # Return the key from the country
     return country.get(key)
@@ -0,0 +1,16 @@
+import utils
+import validate
+
+
+def get_eraa_workbooks(year):
+    """
+    Return the filepath and column name of each ERAA workbook with bidding zone data in the order the columns are added
+    """
+    assert validate.is_model_year(year)
+
+    return [
+        (utils.path("input", "eraa", "Demand Data", f"Demand_TimeSeries_{year}_NationalEstimates.xlsx"), "demand_MW"),
+        (utils.path("input", "eraa", "Climate Data", f"PECD_LFSolarPV_{year}_edition 2021.3.xlsx"), "pv_{bidding_zone}_cf"),
+        (utils.path("input", "eraa", "Climate Data", f"PECD_Onshore_{year}_edition 2021.3.xlsx"), "onshore_{bidding_zone}_cf"),
+        (utils.path("input", "eraa", "Climate Data", f"PECD_Offshore_{year}_edition 2021.3.xlsx"), "offshore_{bidding_zone}_cf"),
+    ]
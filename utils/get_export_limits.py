@@ -1,3 +1,4 @@
+import pandas as pd
 import streamlit as st
 
 import utils
@@ -5,25 +6,62 @@ import validate
 
 
 @st.experimental_memo(show_spinner=False)
-def _read_and_map_export_limits(*, model_year, connection_type, timestamps):
+def _read_export_limits(*, model_year, connection_type, resolution):
     """
-    Read the export limits and map them to the given timestamps
+    Read and resample the export limits and create an index with the column position of each interconnection from and to each bidding zone
     """
     assert validate.is_model_year(model_year)
     assert validate.is_interconnection_type(connection_type)
-    assert validate.is_series(timestamps)
 
     # Read the interconnection CSV file
     filepath = utils.path("input", "interconnections", model_year, f"{connection_type}.csv")
     export_limits = utils.read_csv(filepath, parse_dates=True, index_col=0, header=[0, 1])
 
     # Resample the export limits if required
-    if len(export_limits.index) != len(timestamps):
-        resolution = timestamps[1] - timestamps[0]
+    if resolution != export_limits.index[1] - export_limits.index[0]:
         export_limits = export_limits.resample(resolution).mean()
 
-    # Remap the export limits from the model year to the selected years
-    return timestamps.apply(lambda timestamp: export_limits.loc[timestamp.replace(year=model_year)])
+    # Create the link index, so the interconnections of a bidding zone don't have to be searched in all columns
+    link_index = {"export": {}, "import": {}}
+    for column_position, (bidding_zone_from, bidding_zone_to) in enumerate(export_limits.columns):
+        link_index["export"].setdefault(bidding_zone_from, {})[bidding_zone_to] = column_position
+        link_index["import"].setdefault(bidding_zone_to, {})[bidding_zone_from] = column_position
+
+    return export_limits, link_index
+
+
+def _get_timestamp_keys(index):
+    """
+    Return an integer key of the month, day, hour, and minute of each timestamp, so timestamps in different years can be matched
+    """
+    assert validate.is_datetime_index(index)
+
+    return ((index.month.to_numpy() * 32 + index.day.to_numpy()) * 24 + index.hour.to_numpy()) * 60 + index.minute.to_numpy()
+
+
+@st.experimental_memo(show_spinner=False)
+def _get_row_positions(*, model_year, connection_type, resolution, first_timestamp, last_timestamp, timestamp_count, _index):
+    """
+    Return the row position in the export limits of the model year for each timestamp, the timestamps are not hashed so they're cached by their first and last timestamp, count, and resolution
+    """
+    assert validate.is_model_year(model_year)
+    assert validate.is_interconnection_type(connection_type)
+    assert validate.is_string(first_timestamp)
+    assert validate.is_string(last_timestamp)
+    assert validate.is_integer(timestamp_count, min_value=1)
+    assert validate.is_datetime_index(_index)
+    assert str(_index[0]) == first_timestamp and str(_index[-1]) == last_timestamp and len(_index) == timestamp_count
+
+    # Find the row with the same month, day, and time in the export limits for each timestamp
+    export_limits, link_index = _read_export_limits(model_year=model_year, connection_type=connection_type, resolution=resolution)
+    row_positions = pd.Index(_get_timestamp_keys(export_limits.index)).get_indexer(_get_timestamp_keys(_index))
+
+    # Raise an error if one of the timestamps doesn't exist in the model year
+    if (row_positions == -1).any():
+        missing_timestamp = _index[row_positions == -1][0]
+        raise KeyError(f"There are no export limits for {missing_timestamp.replace(year=model_year)}")
+
+    return row_positions
 
 
 def get_export_limits(bidding_zone, *, config, connection_type, index, direction="export"):
@@ -36,12 +74,19 @@ def get_export_limits(bidding_zone, *, config, connection_type, index, direction
     assert validate.is_datetime_index(index)
     assert validate.is_interconnection_direction(direction)
 
-    # Read and map the export limits
-    export_limits = _read_and_map_export_limits(model_year=config["model_year"], connection_type=connection_type, timestamps=index.to_series())
+    # Read the export limits
+    resolution = index[1] - index[0]
+    export_limits, link_index = _read_export_limits(model_year=config["model_year"], connection_type=connection_type, resolution=resolution)
+
+    # Get the row positions of the timestamps, the first and last timestamp are passed as strings since the cache can't hash timestamps with a time zone
+    row_positions = _get_row_positions(model_year=config["model_year"], connection_type=connection_type, resolution=resolution, first_timestamp=str(index[0]), last_timestamp=str(index[-1]), timestamp_count=len(index), _index=index)
+
+    # Get the interconnections to the other modelled bidding zones from the link index in the order of the bidding zones
+    bidding_zone_order = {zone: zone_index for zone_index, zone in enumerate(utils.get_bidding_zones_for_countries(config["country_codes"]))}
+    links = link_index[direction].get(bidding_zone, {})
+    relevant_zones = sorted([zone for zone in links if zone in bidding_zone_order], key=bidding_zone_order.get)
+    column_positions = [links[zone] for zone in relevant_zones]
 
-    relevant_interconnections = []
-    for zone in utils.get_bidding_zones_for_countries(config["country_codes"]):
-        interconnection = (bidding_zone, zone) if direction == "export" else (zone, bidding_zone)
-        if interconnection in export_limits.columns:
-            relevant_interconnections.append(interconnection)
-    return export_limits[relevant_interconnections]
+    # Remap the export limits of the relevant interconnections from the model year to the selected years at once
+    values = export_limits.to_numpy()[:, column_positions].take(row_positions, axis=0)
+    return pd.DataFrame(values, index=index, columns=export_limits.columns[column_positions])
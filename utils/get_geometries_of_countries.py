@@ -11,8 +11,7 @@ def get_geometries_of_countries(country_codes):
     # Get a list of all included geographic units and all excluded geographic sub-units
     included_geographic_units = []
     excluded_geographic_subunits = []
-    countries = utils.read_yaml(utils.path("input", "countries.yaml"))
-    relevant_countries = [country for country in countries if country["nuts_2"] in country_codes]
+    relevant_countries = [country for country in utils.country_registry.get_countries() if country["nuts_2"] in country_codes]
     for country in relevant_countries:
         included_geographic_units.extend(country.get("included_geographic_units") or [])
         excluded_geographic_subunits.extend(country.get("excluded_geographic_subunits") or [])
@@ -24,7 +23,7 @@ def get_geometries_of_countries(country_codes):
 
     # Merge the regions for each country and set the nuts_2 country code as the index
     map_df = map_df.dissolve(by="SOV_A3")
-    map_df["nuts_2"] = map_df.apply(lambda row: utils.get_country_property(row.ADM0_A3, "nuts_2", code_type="alpha_3"), axis=1)
+    map_df["nuts_2"] = map_df.ADM0_A3.map(lambda alpha_3: utils.country_registry.get_country(alpha_3, code_type="alpha_3")["nuts_2"])
     map_df = map_df.set_index("nuts_2")
 
     # Return a DataFrame with only the 'geometry' column
@@ -23,8 +23,7 @@ def get_production_capacity(output_directory, resolution, *, group=None, country
     # Get the production capacity for each bidding zone
     production_capacity = {}
     for bidding_zone in utils.get_bidding_zones_for_countries(country_codes):
-        filepath = output_directory / resolution / "production_capacities" / f"{bidding_zone}.csv"
-        production_capacity[bidding_zone] = utils.read_csv(filepath, index_col=0)
+        production_capacity[bidding_zone] = utils.read_output_file(output_directory / resolution / "production_capacities", bidding_zone)
 
     # Return a dictionary with the production capacity per bidding zone DataFrame if not grouped
     if group is None:
@@ -19,11 +19,11 @@ def get_production_potential_in_climate_zone(bidding_zone, production_technology
     if not production_potential:
         return float("inf")
 
-    # Calculate the number of climate zones in the country
+    # Calculate the number of climate zones in the country with the climate zone index of all modelled bidding zones
+    climate_zone_index = utils.get_climate_zone_index(config["model_year"], utils.get_bidding_zones_for_countries(config["country_codes"]))
     climate_zone_count = 0
     for bidding_zone_in_country in utils.get_country_property(country_code, "bidding_zones"):
-        temporal_data = utils.read_temporal_data(utils.path("input", "bidding_zones", config["model_year"], f"{bidding_zone_in_country}.csv"))
-        climate_zone_count += len([column for column in temporal_data.columns if column.startswith(f"{production_technology}_")])
+        climate_zone_count += len(climate_zone_index[bidding_zone_in_country]["climate_zones"].get(production_technology, []))
 
     # Return the production potential in the country divided by the number of climate zones in the country
     return production_potential / climate_zone_count
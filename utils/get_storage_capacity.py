@@ -23,8 +23,7 @@ def get_storage_capacity(output_directory, resolution, *, group=None, country_co
     # Get the storage capacity for each bidding zone
     storage_capacity = {}
     for bidding_zone in utils.get_bidding_zones_for_countries(country_codes):
-        filepath = output_directory / resolution / "storage_capacities" / f"{bidding_zone}.csv"
-        storage_capacity[bidding_zone] = utils.read_csv(filepath, index_col=0)
+        storage_capacity[bidding_zone] = utils.read_output_file(output_directory / resolution / "storage_capacities", bidding_zone)
 
     # Return a dictionary with the storage capacity per bidding zone DataFrame if not grouped
     if group is None:
@@ -5,14 +5,17 @@ import validate
 
 
 @st.experimental_memo(show_spinner=False)
-def get_temporal_results(output_directory, resolution, *, group=None, country_codes=None):
+def get_temporal_results(output_directory, resolution, *, group=None, country_codes=None, columns=None, start=None, end=None):
     """
-    Return the (grouped) production capacity
+    Return the (grouped) temporal results, optionally only the given columns and the rows within a time range
     """
     assert validate.is_directory_path(output_directory)
     assert validate.is_resolution(resolution)
     assert validate.is_aggregation_level(group, required=False)
     assert validate.is_country_code_list(country_codes, code_type="nuts_2", required=False)
+    assert validate.is_list_like(columns, required=False)
+    assert validate.is_datetime(start, required=False)
+    assert validate.is_datetime(end, required=False)
 
     # If no countries are specified, set them to all countries modelled in this run
     if not country_codes:
@@ -22,8 +25,7 @@ def get_temporal_results(output_directory, resolution, *, group=None, country_co
     # Get the temporal data for each bidding zone
     temporal_results = {}
     for bidding_zone in utils.get_bidding_zones_for_countries(country_codes):
-        filepath = output_directory / resolution / "temporal_results" / f"{bidding_zone}.csv"
-        temporal_results[bidding_zone] = utils.read_temporal_data(filepath)
+        temporal_results[bidding_zone] = utils.read_output_file(output_directory / resolution / "temporal_results", bidding_zone, columns=columns, start=start, end=end, parse_dates=True)
 
         if temporal_results[bidding_zone].isnull().values.any():
             st.warning(f"Bidding zone {bidding_zone} contains NaN values")
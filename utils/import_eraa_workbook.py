@@ -0,0 +1,107 @@
+import pandas as pd
+
+import utils
+import validate
+
+
+def _sheet_belongs_to_zone(sheet_name, bidding_zone, *, countries):
+    """
+    Check if a specific sheet belongs to a bidding zone
+    """
+    assert validate.is_string(sheet_name)
+    assert validate.is_bidding_zone(bidding_zone)
+    assert validate.is_list_like(countries)
+
+    # Return True if its an exact match
+    if sheet_name == bidding_zone:
+        return True
+
+    # If the country has only 1 bidding zone, just check the first two letters
+    if len([z for country in countries for z in country["bidding_zones"] if z.startswith(bidding_zone[:2])]) < 2:
+        return sheet_name.startswith(bidding_zone[:2])
+
+    exceptions = {
+        "DKKF": None,
+        "FR01": "FR00",
+        "FR02": "FR00",
+        "FR03": "FR00",
+        "FR04": "FR00",
+        "FR05": "FR00",
+        "FR06": "FR00",
+        "FR07": "FR00",
+        "FR08": "FR00",
+        "FR09": "FR00",
+        "FR10": "FR00",
+        "FR11": "FR00",
+        "FR12": "FR00",
+        "FR13": "FR00",
+        "FR14": "FR00",
+        "GR01": "GR00",
+        "GR02": "GR00",
+        "LU00": None,
+        "LUV1": None,
+        "NOS1": "NOS0",
+        "NOS2": "NOS0",
+        "NOS3": "NOS0",
+        "UK01": "UK00",
+        "UK02": "UK00",
+        "UK03": "UK00",
+        "UK04": "UK00",
+        "UK05": "UK00",
+    }
+
+    # Check if the bidding zone is part of the exception list
+    if exceptions.get(sheet_name) is not None:
+        return exceptions.get(sheet_name) == bidding_zone
+
+    # Return false if its not an exact match, the country has multiple bidding zones and its not an exception
+    return False
+
+
+def import_eraa_workbook(filepath, *, bidding_zones, column_name):
+    """
+    Read each relevant sheet of an ERAA workbook once and return a data DataFrame with a column per sheet for each bidding zone
+    """
+    assert validate.is_filepath(filepath)
+    assert validate.is_bidding_zone_list(bidding_zones)
+    assert validate.is_string(column_name)
+
+    # Read the countries only once, they're required to match the sheets to the bidding zones
+    countries = utils.country_registry.get_countries()
+
+    # Open the Excel file only once for all sheets
+    data = {}
+    with pd.ExcelFile(filepath) as excel_file:
+        for sheet_name in sorted(excel_file.sheet_names):
+            # Skip the sheet if it doesn't belong to any of the bidding zones
+            sheet_bidding_zones = [bidding_zone for bidding_zone in bidding_zones if _sheet_belongs_to_zone(sheet_name, bidding_zone, countries=countries)]
+            if not sheet_bidding_zones:
+                continue
+
+            # Import the Excel sheet for a zone
+            usecols_func = lambda col: col in ["Date", "Hour"] or isinstance(col, int)
+            sheet = pd.read_excel(excel_file, sheet_name=sheet_name, index_col=[0, 1], skiprows=10, usecols=usecols_func)
+            formatted_column_name = column_name.replace("{bidding_zone}", sheet_name[2:])
+
+            # Transform the sheet DataFrame to a Series with appropriate index by concatenating the climate year columns at once
+            new_column = pd.concat([sheet[year_column].set_axis(utils.create_datetime_index(sheet.index, year_column)) for year_column in sheet.columns])
+
+            # Don't include the column if it contains NaN values (only applicable to DEKF)
+            if new_column.isna().any():
+                print(f"  - Column {formatted_column_name} contains NaN values and is not included")
+                continue
+
+            # Don't include the column if it only contains zeroes (only applicable to offshore wind in land-locked countries)
+            if new_column.max() == 0.0:
+                print(f"  - Column {formatted_column_name} contains only zeroes and is not included")
+                continue
+
+            # Add the new column to the DataFrame of each bidding zone or create a new data DataFrame if it doesn't exist yet
+            for bidding_zone in sheet_bidding_zones:
+                if data.get(bidding_zone) is None:
+                    data[bidding_zone] = new_column.rename(formatted_column_name).to_frame()
+                else:
+                    data[bidding_zone][formatted_column_name] = new_column
+
+    # Return the dictionary with the data DataFrame of each bidding zone
+    return data
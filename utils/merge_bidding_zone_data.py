@@ -0,0 +1,19 @@
+import validate
+
+
+def merge_bidding_zone_data(data, new_data):
+    """
+    Add the columns of the data DataFrames imported from a workbook to the data DataFrames of each bidding zone
+    """
+    assert validate.is_dict(data)
+    assert validate.is_dict(new_data)
+
+    for bidding_zone, new_data_bidding_zone in new_data.items():
+        if data.get(bidding_zone) is None:
+            data[bidding_zone] = new_data_bidding_zone
+        else:
+            for column_name in new_data_bidding_zone.columns:
+                data[bidding_zone][column_name] = new_data_bidding_zone[column_name]
+
+    # Return the dictionary with the merged columns
+    return data
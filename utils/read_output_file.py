@@ -0,0 +1,46 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import streamlit as st
+
+import utils
+import validate
+
+
+@st.experimental_memo(show_spinner=False)
+def read_output_file(directory, name, *, columns=None, start=None, end=None, parse_dates=False, column_levels=1):
+    """
+    Read an output file that is stored as .parquet or .csv file, optionally only the given columns and the rows within a time range
+    """
+    assert validate.is_directory_path(directory, existing=True)
+    assert validate.is_string(name, min_length=1)
+    assert validate.is_list_like(columns, required=False)
+    assert validate.is_datetime(start, required=False)
+    assert validate.is_datetime(end, required=False)
+    assert validate.is_bool(parse_dates)
+    assert validate.is_integer(column_levels, min_value=1)
+
+    # Interpret a start and end without timezone as UTC, the timezone of the output files
+    if start is not None:
+        start = pd.Timestamp(start, tz="UTC") if start.tzinfo is None else pd.Timestamp(start)
+    if end is not None:
+        end = pd.Timestamp(end, tz="UTC") if end.tzinfo is None else pd.Timestamp(end)
+
+    parquet_filepath = directory / f"{name}.parquet"
+    if parquet_filepath.is_file():
+        # Only read the required columns and filter the rows on the index while reading
+        filters = []
+        if start is not None or end is not None:
+            index_column = pq.read_schema(parquet_filepath).pandas_metadata["index_columns"][0]
+            if start is not None:
+                filters.append((index_column, ">=", start))
+            if end is not None:
+                filters.append((index_column, "<=", end))
+        return pd.read_parquet(parquet_filepath, columns=list(columns) if columns is not None else None, filters=filters or None)
+
+    # Read the .csv file of runs that have been stored as CSV and select the columns and rows afterwards
+    data = utils.read_csv(directory / f"{name}.csv", index_col=0, parse_dates=parse_dates, header=list(range(column_levels)) if column_levels > 1 else 0)
+    if columns is not None:
+        data = data[list(columns)]
+    if start is not None or end is not None:
+        data = data[start:end]
+    return data
@@ -1,24 +1,38 @@
 import datetime
+import pandas as pd
 import pytz
 
 import utils
 import validate
 
 
-def read_temporal_data(filepath, *, start_year=None, end_year=None):
+def read_temporal_data(filepath, *, start_year=None, end_year=None, columns=None):
     """
-    Returns the temporal data, if specified only for a specific date range
+    Returns the temporal data, if specified only for a specific date range and specific columns
     """
-    assert validate.is_filepath(filepath, suffix=".csv", existing=True)
+    assert validate.is_filepath(filepath, suffix=".csv")
     assert validate.is_integer(start_year, min_value=1982, max_value=2016, required=False)
     assert validate.is_integer(end_year, min_value=1982, max_value=2016, required=False)
-
-    temporal_data = utils.read_csv(filepath, parse_dates=True, index_col=0)
+    assert validate.is_list_like(columns, required=False)
 
     # Set the time to the beginning and end of the start and end date respectively
     tzinfo = pytz.timezone("UTC")
     start = datetime.datetime(start_year, 1, 1, 0, 0, 0, tzinfo=tzinfo) if start_year else None
     end = datetime.datetime(end_year, 12, 31, 0, 0, 0, tzinfo=tzinfo) if end_year else None
 
+    # Read only the required climate years and columns from the temporal data store if it has been created during preprocessing
+    store_directory = filepath.with_suffix("")
+    if (store_directory / "manifest.yaml").is_file():
+        manifest = utils.read_yaml(store_directory / "manifest.yaml")
+        climate_years = [climate_year for climate_year in manifest["climate_years"] if (start_year is None or climate_year >= start_year) and (end_year is None or climate_year <= end_year)]
+        temporal_data = pd.concat([pd.read_parquet(store_directory / f"{climate_year}.parquet", columns=list(columns) if columns is not None else None) for climate_year in climate_years])
+        return temporal_data[start:end]
+
+    # Otherwise read the CSV file
+    assert validate.is_filepath(filepath, existing=True)
+    temporal_data = utils.read_csv(filepath, parse_dates=True, index_col=0)
+    if columns is not None:
+        temporal_data = temporal_data[list(columns)]
+
     # Return the temporal data
     return temporal_data[start:end]
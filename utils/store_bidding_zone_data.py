@@ -0,0 +1,16 @@
+import utils
+import validate
+
+
+def store_bidding_zone_data(data, *, bidding_zone, year):
+    """
+    Store the data of a bidding zone in a CSV file and in a store with a file per climate year
+    """
+    assert validate.is_dataframe(data)
+    assert validate.is_bidding_zone(bidding_zone)
+    assert validate.is_model_year(year)
+
+    filepath = utils.path("input", "bidding_zones", year, f"{bidding_zone}.csv")
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    data.to_csv(filepath)
+    utils.create_temporal_data_store(data, filepath.with_suffix(""))
@@ -0,0 +1,103 @@
+import numpy as np
+import os
+import yaml
+
+import validate
+
+from .path import path
+
+
+class TechnologyRegistry:
+    """
+    An index of the technology assumptions in production.yaml and storage.yaml with their derived parameters as arrays, read only once per working directory
+    """
+
+    technology_types = ["production", "storage"]
+    scenarios = ["conservative", "moderate", "advanced"]
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.working_directory = None
+
+    def _load(self):
+        """
+        Read the technology assumptions and create the arrays if the files haven't been read yet from the current working directory
+        """
+        working_directory = os.getcwd()
+        if working_directory == self.working_directory:
+            return
+
+        self.assumptions = {}
+        self.positions = {}
+        self.parameters = {}
+        self.scenario_costs = {}
+        for technology_type in self.technology_types:
+            # Read the file without the Streamlit cache, so the registry also works without Streamlit
+            with open(self.directory / f"{technology_type}.yaml") as f:
+                assumptions = yaml.load(f, Loader=yaml.SafeLoader)
+            self.assumptions[technology_type] = assumptions
+            self.positions[technology_type] = {technology: position for position, technology in enumerate(assumptions)}
+
+            # Create an array for each scalar parameter, a parameter that is missing for a technology is NaN
+            parameter_names = {key for technology_assumptions in assumptions.values() for key in technology_assumptions if key not in self.scenarios}
+            self.parameters[technology_type] = {parameter_name: np.array([technology_assumptions.get(parameter_name, np.nan) for technology_assumptions in assumptions.values()], dtype="float64") for parameter_name in parameter_names}
+
+            # Precompute the Capital Recovery Factor and the one-way storage efficiency
+            self.parameters[technology_type]["crf"] = np.array([technology_assumptions["wacc"] / (1 - (1 + technology_assumptions["wacc"]) ** (-technology_assumptions["economic_lifetime"])) for technology_assumptions in assumptions.values()])
+            if technology_type == "storage":
+                self.parameters[technology_type]["efficiency"] = np.array([technology_assumptions["roundtrip_efficiency"] ** 0.5 for technology_assumptions in assumptions.values()])
+
+            # Create a (scenario, technology) array for each cost variable
+            variables = {variable for technology_assumptions in assumptions.values() for scenario in self.scenarios for variable in technology_assumptions.get(scenario, {})}
+            self.scenario_costs[technology_type] = {variable: np.array([[technology_assumptions.get(scenario, {}).get(variable, np.nan) for technology_assumptions in assumptions.values()] for scenario in self.scenarios], dtype="float64") for variable in variables}
+
+        self.working_directory = working_directory
+
+    def get_technologies(self, technology_type):
+        """
+        Return a list with all technologies of a technology type
+        """
+        assert validate.is_technology_type(technology_type)
+
+        self._load()
+        return list(self.positions[technology_type])
+
+    def get_assumptions(self, technology_type, technology):
+        """
+        Return the assumptions of a technology
+        """
+        assert validate.is_technology_type(technology_type)
+        assert validate.is_technology(technology)
+
+        self._load()
+        return self.assumptions[technology_type][technology]
+
+    def get_parameter(self, technology_type, parameter_name, technologies):
+        """
+        Return an array with a scalar parameter for each of the given technologies
+        """
+        assert validate.is_technology_type(technology_type)
+        assert validate.is_string(parameter_name)
+        assert validate.is_list_like(technologies)
+
+        self._load()
+        positions = [self.positions[technology_type][technology] for technology in technologies]
+        return self.parameters[technology_type][parameter_name][positions]
+
+    def get_scenario_costs(self, technology_type, variable, scenario_levels):
+        """
+        Return an array with the costs for each technology at its scenario level, interpolated between the moderate and the conservative or advanced scenario
+        """
+        assert validate.is_technology_type(technology_type)
+        assert validate.is_string(variable)
+        assert validate.is_dict(scenario_levels)
+        assert all(validate.is_number(scenario_level, min_value=-1, max_value=1) for scenario_level in scenario_levels.values())
+
+        self._load()
+        positions = [self.positions[technology_type][technology] for technology in scenario_levels]
+        conservative, moderate, advanced = self.scenario_costs[technology_type][variable][:, positions]
+        scenario_level = np.array(list(scenario_levels.values()), dtype="float64")
+        return np.where(scenario_level >= 0, (1 - scenario_level) * moderate + scenario_level * advanced, (1 + scenario_level) * moderate - scenario_level * conservative)
+
+
+technology_registry = TechnologyRegistry(path("input", "technologies"))
@@ -0,0 +1,16 @@
+import validate
+
+
+def write_output_file(data, directory, name, *, output_format="csv"):
+    """
+    Store a DataFrame as compressed .parquet file or as .csv file
+    """
+    assert validate.is_dataframe(data)
+    assert validate.is_directory_path(directory, existing=True)
+    assert validate.is_string(name, min_length=1)
+    assert validate.is_output_format(output_format)
+
+    if output_format == "parquet":
+        data.to_parquet(directory / f"{name}.parquet", compression="zstd")
+    else:
+        data.to_csv(directory / f"{name}.csv")
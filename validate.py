@@ -100,12 +100,16 @@ def is_config(value, *, required=True):
         return False
     if not is_resolution_stages(value["time_discretization"].get("resolution_stages")):
         return False
+    if not is_integer(value["time_discretization"].get("warm_start_method"), min_value=-1, max_value=6, required=False):
+        return False
     if not value.get("optimization"):
         return False
     if not is_integer(value["optimization"].get("method"), min_value=-1, max_value=6):
         return False
     if not is_integer(value["optimization"].get("thread_count"), min_value=1):
         return False
+    if not is_output_format(value["optimization"].get("output_format"), required=False):
+        return False
     return True
 
 
@@ -191,7 +195,7 @@ def is_datetime(value, *, required=True):
     if value is None:
         return not required
 
-    return type(value) is datetime.datetime
+    return isinstance(value, datetime.datetime)
 
 
 def is_datetime_index(value, *, required=True):
@@ -355,6 +359,13 @@ def is_number(value, *, required=True, min_value=None, max_value=None):
     return is_float(value, min_value=min_value, max_value=max_value) or is_integer(value, min_value=min_value, max_value=max_value)
 
 
+def is_output_format(value, *, required=True):
+    if value is None:
+        return not required
+
+    return value in ["csv", "parquet"]
+
+
 def is_point(value, *, required=True):
     if value is None:
         return not required
@@ -393,7 +404,22 @@ def is_sensitivity_config(value, *, required=True):
     if not type(value) is dict:
         return False
 
-    return value["analysis_type"] in ["curtailment", "climate_years", "technology_scenario", "baseload", "interconnection_capacity", "self_sufficiency"]
+    if value.get("analysis_type") not in ["curtailment", "climate_years", "technology_scenario", "baseload", "interconnection_capacity", "self_sufficiency"]:
+        return False
+
+    # The root finding search requires the target curtailment levels and a positive tolerance
+    search_method = value.get("search_method", "step_factor")
+    if search_method not in ["step_factor", "root_finding"]:
+        return False
+    if search_method == "root_finding":
+        curtailment_targets = value.get("curtailment_targets")
+        if not is_list_like(curtailment_targets) or len(curtailment_targets) == 0:
+            return False
+        if not all(is_number(curtailment_target, min_value=0, max_value=1) for curtailment_target in curtailment_targets):
+            return False
+        if not is_number(value.get("curtailment_tolerance")) or value["curtailment_tolerance"] <= 0:
+            return False
+    return True
 
 
 def is_series(value, *, required=True):